@@ -59,8 +59,9 @@ class AutoPkgPrefs:
     _DEFAULT_PREF_FILE_PATH = Path(
         "~/Library/Preferences/com.github.autopkg.plist"
     ).expanduser()
+    _IN_MEMORY_SOURCE = Path("<in-memory>")
 
-    def __init__(self, file_path: Path = _DEFAULT_PREF_FILE_PATH) -> None:
+    def __init__(self, file_path: Path | bytes = _DEFAULT_PREF_FILE_PATH) -> None:
         """Loads the contents of `file_path` and initializes preferences.
 
         The `_prefs` dictionary is populated with default preferences in their raw
@@ -68,13 +69,19 @@ class AutoPkgPrefs:
         override or add to these defaults.
 
         Args:
-            file_path: The path to the preference file. Defaults to
-                `~/Library/Preferences/com.github.autopkg.plist`. This file can be in
-                JSON or Plist format.
+            file_path: The path to the preference file, or the raw preference
+                contents as bytes. Defaults to
+                `~/Library/Preferences/com.github.autopkg.plist`. The contents
+                can be in JSON or Plist format.
         """
         self._prefs: dict[str, Any] = self._get_default_preferences()
 
-        file_contents = self._get_preference_file_contents(file_path)
+        if isinstance(file_path, bytes):
+            file_contents = self._parse_preference_contents(
+                file_path, self._IN_MEMORY_SOURCE
+            )
+        else:
+            file_contents = self._get_preference_file_contents(file_path)
         self._prefs.update(file_contents)
 
     def __enter__(self) -> "AutoPkgPrefs":
@@ -212,6 +219,29 @@ class AutoPkgPrefs:
         except FileNotFoundError as exc:
             raise PreferenceFileNotFoundError(file_path) from exc
 
+        return AutoPkgPrefs._parse_preference_contents(file_contents, file_path)
+
+    @staticmethod
+    def _parse_preference_contents(
+        file_contents: bytes, source: Path
+    ) -> dict[str, Any]:
+        """Parses raw preference contents as JSON or plist.
+
+        Attempts to parse the bytes first as JSON, then as a macOS plist if
+        JSON decoding fails. Only if both formats fail will an
+        `InvalidFileContentsError` error be raised.
+
+        Args:
+            file_contents: The raw preference data.
+            source: The origin of the data, used in error reporting.
+
+        Returns:
+            A dictionary representing the parsed preferences.
+
+        Raises:
+            InvalidFileContentsError: If the contents cannot be parsed as
+                either JSON or a plist.
+        """
         prefs: dict[str, Any] = {}
         try:
             prefs = json.loads(file_contents.decode("utf-8"))
@@ -219,7 +249,7 @@ class AutoPkgPrefs:
             try:
                 prefs = plistlib.loads(file_contents)
             except plistlib.InvalidFileException as exc:
-                raise InvalidFileContentsError(file_path) from exc
+                raise InvalidFileContentsError(source) from exc
 
         return prefs
 
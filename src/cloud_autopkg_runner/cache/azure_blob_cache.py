@@ -8,17 +8,48 @@ an asyncio lock to prevent race conditions.
 """
 
 import asyncio
+import gzip
 import json
+import os
 from types import TracebackType
 from typing import Protocol, runtime_checkable
+from urllib.parse import urlparse
 
+import aiohttp
 from azure.core.credentials import AzureNamedKeyCredential
+from azure.core.pipeline.transport import AioHttpTransport
 from azure.identity.aio import DefaultAzureCredential
+from azure.storage.blob import ContentSettings
 from azure.storage.blob.aio import BlobClient, BlobServiceClient
 
 from cloud_autopkg_runner import Settings, logging_config
 from cloud_autopkg_runner.metadata_cache import MetadataCache, RecipeCache, RecipeName
 
+_GZIP_MAGIC = b"\x1f\x8b"
+
+_MSGPACK_SUFFIX = ".msgpack"
+
+_LOCAL_HOSTNAMES = frozenset({"127.0.0.1", "localhost", "::1"})
+
+
+def _is_emulator(account_url: str) -> bool:
+    """Determine whether the account URL points at a local storage emulator.
+
+    Emulators such as Azurite accept the well-known development account key,
+    so walking the `DefaultAzureCredential` chain (environment, managed
+    identity, CLI, ...) against them is pure startup cost. Detection can also
+    be forced by setting the `AZURE_STORAGE_EMULATOR` environment variable.
+
+    Args:
+        account_url: The Azure Blob Storage account URL.
+
+    Returns:
+        True if the URL targets a local emulator, False otherwise.
+    """
+    if os.environ.get("AZURE_STORAGE_EMULATOR"):
+        return True
+    return urlparse(account_url).hostname in _LOCAL_HOSTNAMES
+
 
 @runtime_checkable
 class AsyncCloseable(Protocol):
@@ -70,33 +101,51 @@ class AsyncAzureBlobCache:
     _instance: "AsyncAzureBlobCache | None" = None  # Singleton instance
     _lock: asyncio.Lock = asyncio.Lock()  # Asynchronous lock for thread safety
 
-    def __new__(cls) -> "AsyncAzureBlobCache":
+    def __new__(
+        cls, service_client: BlobServiceClient | None = None
+    ) -> "AsyncAzureBlobCache":
         """Singleton implementation.
 
         This method ensures that only one instance of the `AsyncAzureBlobCache`
         class is created. If an instance already exists, it returns the existing
         instance; otherwise, it creates a new instance.
 
+        Args:
+            service_client: An optional externally managed `BlobServiceClient`.
+                Passed through to `__init__`.
+
         Returns:
             The singleton instance of `AsyncAzureBlobCache`.
         """
+        _ = service_client
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
-        """Initialize the AsyncAzureBlobCache instance."""
+    def __init__(self, service_client: BlobServiceClient | None = None) -> None:
+        """Initialize the AsyncAzureBlobCache instance.
+
+        Args:
+            service_client: An optional externally managed `BlobServiceClient`.
+                When provided, the cache reuses its connection pool and
+                credentials instead of constructing a client of its own, and
+                does not close it on `close()`.
+        """
         if hasattr(self, "_initialized"):
             return
 
         settings = Settings()
         self._logger = logging_config.get_logger(__name__)
         self._account_url: str = settings.azure_account_url
+        self._max_concurrency: int = settings.max_concurrency
         self._container_name: str = settings.cloud_container_name
         self._blob_name: str = settings.cache_file
         self._cache_data: MetadataCache = {}
         self._is_loaded: bool = False
         self._client: BlobClient
+        self._owns_service_client: bool = service_client is None
+        if service_client is not None:
+            self._blob_service_client = service_client
 
         self._initialized: bool = True
 
@@ -105,24 +154,69 @@ class AsyncAzureBlobCache:
         if hasattr(self, "_client"):
             return
 
-        if "127.0.0.1" in self._account_url:
-            # Emulator mode
-            self._credential = AzureNamedKeyCredential(
-                name="devstoreaccount1",
-                key=(
-                    "Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6"
-                    "IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw=="
-                ),
+        if not hasattr(self, "_blob_service_client"):
+            if _is_emulator(self._account_url):
+                # Emulator mode
+                self._credential = AzureNamedKeyCredential(
+                    name="devstoreaccount1",
+                    key=(
+                        "Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6"
+                        "IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw=="
+                    ),
+                )
+            else:
+                self._credential = DefaultAzureCredential()
+            # Size the aiohttp connection pool to the configured concurrency
+            # instead of relying on aiohttp's default of 100; the transport
+            # only honors a pool size supplied through an explicit session.
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._max_concurrency)
+            )
+            transport = AioHttpTransport(session=session, session_owner=True)
+            self._blob_service_client = BlobServiceClient(
+                account_url=self._account_url,
+                credential=self._credential,
+                transport=transport,
             )
-        else:
-            self._credential = DefaultAzureCredential()
-        self._blob_service_client = BlobServiceClient(
-            account_url=self._account_url, credential=self._credential
-        )
         self._client = self._blob_service_client.get_blob_client(
             container=self._container_name, blob=self._blob_name
         )
 
+    def _serialize(self) -> tuple[bytes, str]:
+        """Serialize the in-memory cache for upload.
+
+        The wire format follows the cache file extension: a `.msgpack` name
+        selects MessagePack (smaller payloads, faster decode; requires the
+        optional `msgpack` package), anything else human-readable JSON.
+
+        Returns:
+            The serialized payload and its content type.
+        """
+        if self._blob_name.endswith(_MSGPACK_SUFFIX):
+            import msgpack  # noqa: PLC0415  (optional dependency, loaded on demand)
+
+            return (
+                msgpack.packb(self._cache_data, use_bin_type=True),
+                "application/msgpack",
+            )
+        content = json.dumps(self._cache_data, indent=4).encode("utf-8")
+        return content, "application/json"
+
+    def _deserialize(self, content: bytes) -> MetadataCache:
+        """Parse a downloaded cache payload into its in-memory form.
+
+        Args:
+            content: The raw (already decompressed) payload bytes.
+
+        Returns:
+            The parsed metadata cache.
+        """
+        if self._blob_name.endswith(_MSGPACK_SUFFIX):
+            import msgpack  # noqa: PLC0415  (optional dependency, loaded on demand)
+
+            return msgpack.unpackb(content, raw=False)
+        return json.loads(content)
+
     async def load(self) -> MetadataCache:
         """Load metadata from Azure Blob Storage asynchronously.
 
@@ -145,9 +239,13 @@ class AsyncAzureBlobCache:
                 await self.open()
 
             try:
-                downloader = await self._client.download_blob(encoding="utf-8")
+                downloader = await self._client.download_blob()
                 content = await downloader.readall()
-                self._cache_data = json.loads(content)
+                # Blobs written before compression was introduced are plain
+                # JSON, so only decompress when the gzip magic bytes are there.
+                if content.startswith(_GZIP_MAGIC):
+                    content = gzip.decompress(content)
+                self._cache_data = self._deserialize(content)
                 self._logger.info(
                     "Loaded metadata from azure://%s/%s",
                     self._container_name,
@@ -172,14 +270,27 @@ class AsyncAzureBlobCache:
         This method writes the entire metadata cache to Azure Blob Storage. It uses an
         asyncio lock to ensure thread safety and prevents multiple coroutines
         from writing to the blob simultaneously.
+
+        The JSON payload is gzip-compressed before upload and tagged with
+        `Content-Encoding: gzip`; recipe metadata compresses well, so this
+        cuts bytes over the wire substantially for a small CPU cost.
         """
         async with self._lock:
             if not hasattr(self, "_client"):
                 await self.open()
 
             try:
-                content = json.dumps(self._cache_data, indent=4)
-                await self._client.upload_blob(content.encode("utf-8"), overwrite=True)
+                content, content_type = self._serialize()
+                # compresslevel=1 favors speed over ratio; mtime=0 keeps an
+                # unchanged cache byte-identical across uploads.
+                body = gzip.compress(content, compresslevel=1, mtime=0)
+                await self._client.upload_blob(
+                    body,
+                    overwrite=True,
+                    content_settings=ContentSettings(
+                        content_type=content_type, content_encoding="gzip"
+                    ),
+                )
                 self._logger.debug(
                     "Saved all metadata to azure://%s/%s",
                     self._container_name,
@@ -203,12 +314,15 @@ class AsyncAzureBlobCache:
         to prevent resource leaks.
 
         If any of these clients have not been initialized, they are skipped.
+        An externally provided service client is left open, as its lifecycle
+        is managed by the caller.
         """
         if hasattr(self, "_client"):
             await self.save()
-            await self._client.close()
-            del self._client
-        if hasattr(self, "_blob_service_client"):
+            if self._owns_service_client:
+                await self._client.close()
+                del self._client
+        if hasattr(self, "_blob_service_client") and self._owns_service_client:
             await self._blob_service_client.close()
             del self._blob_service_client
         if hasattr(self, "_credential"):
@@ -224,6 +338,16 @@ class AsyncAzureBlobCache:
 
         await self.save()
 
+    async def invalidate_local_cache(self) -> None:
+        """Discard the in-memory cache without closing the connection.
+
+        Resets the load flag so the next read reloads the data from
+        Azure Blob Storage. Unlike `clear_cache`, nothing is persisted.
+        """
+        async with self._lock:
+            self._cache_data = {}
+            self._is_loaded = False
+
     async def get_item(self, recipe_name: RecipeName) -> RecipeCache | None:
         """Retrieve a specific item from the cache asynchronously.
 
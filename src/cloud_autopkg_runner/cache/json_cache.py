@@ -146,6 +146,16 @@ class AsyncJsonFileCache:
 
         await self.save()
 
+    async def invalidate_local_cache(self) -> None:
+        """Discard the in-memory cache without closing the connection.
+
+        Resets the load flag so the next read reloads the data from
+        the JSON file. Unlike `clear_cache`, nothing is persisted.
+        """
+        async with self._lock:
+            self._cache_data = {}
+            self._is_loaded = False
+
     async def get_item(self, recipe_name: RecipeName) -> RecipeCache | None:
         """Retrieve a specific item from the cache asynchronously.
 
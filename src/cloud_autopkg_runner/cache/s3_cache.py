@@ -10,7 +10,9 @@ getting, setting, and deleting cache items.
 """
 
 import asyncio
+import gzip
 import json
+import zlib
 from types import TracebackType
 from typing import TYPE_CHECKING
 
@@ -23,6 +25,10 @@ from cloud_autopkg_runner.metadata_cache import MetadataCache, RecipeCache, Reci
 if TYPE_CHECKING:
     from types_boto3_s3 import S3Client
 
+_GZIP_MAGIC = b"\x1f\x8b"
+
+_MSGPACK_SUFFIX = ".msgpack"
+
 
 class AsyncS3Cache:
     """Asynchronous implementation of MetadataCachePlugin for S3 storage.
@@ -43,22 +49,33 @@ class AsyncS3Cache:
     _instance: "AsyncS3Cache | None" = None  # Singleton instance
     _lock: asyncio.Lock = asyncio.Lock()  # Asynchronous lock for thread safety
 
-    def __new__(cls) -> "AsyncS3Cache":
+    def __new__(cls, client: "S3Client | None" = None) -> "AsyncS3Cache":
         """Singleton implementation.
 
         This method ensures that only one instance of the `AsyncS3Cache` class
         is created. If an instance already exists, it returns the existing
         instance; otherwise, it creates a new instance.
 
+        Args:
+            client: An optional externally managed S3 client. Passed through
+                to `__init__`.
+
         Returns:
             The singleton instance of `AsyncS3Cache`.
         """
+        _ = client
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self) -> None:
-        """Initialize the AsyncS3Cache instance."""
+    def __init__(self, client: "S3Client | None" = None) -> None:
+        """Initialize the AsyncS3Cache instance.
+
+        Args:
+            client: An optional externally managed S3 client. When provided,
+                the cache reuses its connection pool instead of constructing a
+                client of its own, and does not close it on `close()`.
+        """
         if hasattr(self, "_initialized"):
             return
 
@@ -68,6 +85,9 @@ class AsyncS3Cache:
         self._cache_key: str = settings.cache_file
         self._cache_data: MetadataCache = {}
         self._is_loaded: bool = False
+        self._owns_client: bool = client is None
+        if client is not None:
+            self._client = client
 
         self._initialized: bool = True
 
@@ -86,6 +106,41 @@ class AsyncS3Cache:
         if not hasattr(self, "_client"):
             self._client = await asyncio.to_thread(_make_s3_client)
 
+    def _serialize(self) -> tuple[bytes, str]:
+        """Serialize the in-memory cache for upload.
+
+        The wire format follows the cache file extension: a `.msgpack` key
+        selects MessagePack (smaller payloads, faster decode; requires the
+        optional `msgpack` package), anything else human-readable JSON.
+
+        Returns:
+            The serialized payload and its content type.
+        """
+        if self._cache_key.endswith(_MSGPACK_SUFFIX):
+            import msgpack  # noqa: PLC0415  (optional dependency, loaded on demand)
+
+            return (
+                msgpack.packb(self._cache_data, use_bin_type=True),
+                "application/msgpack",
+            )
+        content = json.dumps(self._cache_data, indent=4).encode("utf-8")
+        return content, "application/json"
+
+    def _deserialize(self, body: bytes) -> MetadataCache:
+        """Parse a downloaded cache payload into its in-memory form.
+
+        Args:
+            body: The raw (already decompressed) payload bytes.
+
+        Returns:
+            The parsed metadata cache.
+        """
+        if self._cache_key.endswith(_MSGPACK_SUFFIX):
+            import msgpack  # noqa: PLC0415  (optional dependency, loaded on demand)
+
+            return msgpack.unpackb(body, raw=False)
+        return json.loads(body)
+
     async def load(self) -> MetadataCache:
         """Load metadata from the S3 bucket asynchronously.
 
@@ -118,7 +173,11 @@ class AsyncS3Cache:
                 )
 
                 body = response["Body"].read()
-                self._cache_data = json.loads(body.decode("utf-8"))
+                # Objects written before compression was introduced are plain
+                # JSON, so only decompress when the gzip magic bytes are there.
+                if body.startswith(_GZIP_MAGIC):
+                    body = gzip.decompress(body)
+                self._cache_data = self._deserialize(body)
 
                 self._logger.info(
                     "Loaded metadata from s3://%s/%s",
@@ -126,7 +185,9 @@ class AsyncS3Cache:
                     self._cache_key,
                 )
 
-            except json.JSONDecodeError:
+            except (ValueError, EOFError, zlib.error, gzip.BadGzipFile):
+                # Covers json.JSONDecodeError, msgpack's unpack errors, and
+                # the truncated/corrupt-stream errors gzip.decompress raises.
                 self._cache_data = {}
                 self._logger.warning(
                     "Metadata object in s3://%s/%s is corrupt, "
@@ -160,18 +221,27 @@ class AsyncS3Cache:
         Serializes the cache data to JSON and uploads it to the S3 bucket.
         This method uses an asyncio lock to ensure thread safety and executes
         the upload in a background thread.
+
+        The JSON payload is gzip-compressed before upload and tagged with
+        `ContentEncoding: gzip`; recipe metadata compresses well, so this
+        cuts bytes over the wire substantially for a small CPU cost.
         """
         async with self._lock:
             if not hasattr(self, "_client"):
                 await self.open()
 
             try:
-                content = json.dumps(self._cache_data, indent=4)
+                content, content_type = self._serialize()
+                # compresslevel=1 favors speed over ratio; mtime=0 keeps an
+                # unchanged cache byte-identical across uploads.
+                body = gzip.compress(content, compresslevel=1, mtime=0)
                 await asyncio.to_thread(
                     self._client.put_object,
                     Bucket=self._bucket_name,
                     Key=self._cache_key,
-                    Body=content.encode("utf-8"),
+                    Body=body,
+                    ContentType=content_type,
+                    ContentEncoding="gzip",
                 )
                 self._logger.debug(
                     "Saved all metadata to s3://%s/%s",
@@ -189,12 +259,14 @@ class AsyncS3Cache:
         """Save cached data and close the S3 connection.
 
         Ensures that any unsaved cache data is written to S3 and closes the S3
-        client connection.
+        client connection. An externally provided client is left open, as its
+        lifecycle is managed by the caller.
         """
         if hasattr(self, "_client"):
             await self.save()
-            self._client.close()
-            del self._client
+            if self._owns_client:
+                self._client.close()
+                del self._client
 
     async def clear_cache(self) -> None:
         """Clear all data from the cache.
@@ -208,6 +280,16 @@ class AsyncS3Cache:
 
         await self.save()
 
+    async def invalidate_local_cache(self) -> None:
+        """Discard the in-memory cache without closing the connection.
+
+        Resets the load flag so the next read reloads the data from
+        the S3 bucket. Unlike `clear_cache`, nothing is persisted.
+        """
+        async with self._lock:
+            self._cache_data = {}
+            self._is_loaded = False
+
     async def get_item(self, recipe_name: RecipeName) -> RecipeCache | None:
         """Retrieve a specific item from the cache asynchronously.
 
@@ -113,6 +113,15 @@ class MetadataCachePlugin(Protocol):
         """
         ...
 
+    async def invalidate_local_cache(self) -> None:
+        """Discard the in-memory cache without closing the connection.
+
+        This method is used to drop the in-memory copy of the cache so that
+        the next read reloads the data from the underlying storage. Unlike
+        `clear_cache`, nothing is persisted.
+        """
+        ...
+
     async def get_item(self, recipe_name: RecipeName) -> RecipeCache | None:
         """Retrieve a specific item from the cache asynchronously.
 
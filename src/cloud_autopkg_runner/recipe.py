@@ -407,22 +407,22 @@ class Recipe:
             InvalidYamlContentsError: If the recipe is a YAML and its contents are
                 malformed.
         """
-        file_contents: str = self._path.read_text()
+        file_contents: bytes = self._path.read_bytes()
 
         if self._format == RecipeFormat.YAML:
             return self._get_contents_yaml(file_contents)
         return self._get_contents_plist(file_contents)
 
-    def _get_contents_plist(self, file_contents: str) -> RecipeContents:
+    def _get_contents_plist(self, file_contents: bytes) -> RecipeContents:
         """Parse a recipe in PLIST format.
 
-        This private method takes the raw string content of a recipe file
+        This private method takes the raw byte content of a recipe file
         and attempts to parse it as an Apple Property List (PLIST) using
         `plistlib.loads()`. It's designed to handle both XML and binary
         PLIST formats.
 
         Args:
-            file_contents: The recipe file contents as a `str`.
+            file_contents: The recipe file contents as `bytes`.
 
         Returns:
             A `RecipeContents` TypedDict containing the recipe's parsed contents.
@@ -433,19 +433,19 @@ class Recipe:
                 content is not a valid PLIST.
         """
         try:
-            return plistlib.loads(file_contents.encode())
+            return plistlib.loads(file_contents)
         except plistlib.InvalidFileException as exc:
             raise InvalidPlistContentsError(self._path) from exc
 
-    def _get_contents_yaml(self, file_contents: str) -> RecipeContents:
+    def _get_contents_yaml(self, file_contents: bytes) -> RecipeContents:
         """Parse a recipe in YAML format.
 
-        This private method takes the raw string content of a recipe file
+        This private method takes the raw byte content of a recipe file
         and attempts to parse it as a YAML document using `yaml.safe_load()`.
         This is used for recipes with a `.yaml` extension.
 
         Args:
-            file_contents: The recipe file contents as a `str`.
+            file_contents: The recipe file contents as `bytes`.
 
         Returns:
             A `RecipeContents` TypedDict containing the recipe's parsed contents.
@@ -0,0 +1,78 @@
+import os
+import secrets
+import uuid
+from collections.abc import Generator
+from urllib.parse import urlparse
+
+import pytest
+
+from cloud_autopkg_runner import Settings
+from cloud_autopkg_runner.cache.azure_blob_cache import AsyncAzureBlobCache
+from cloud_autopkg_runner.cache.gcs_cache import AsyncGCSCache
+from cloud_autopkg_runner.cache.s3_cache import AsyncS3Cache
+from cloud_autopkg_runner.metadata_cache import PluginManager
+
+
+def is_local_emulator(endpoint_url: str) -> bool:
+    """Returns True when the endpoint targets a local storage emulator.
+
+    Emulators such as Azurite and LocalStack are torn down with the CI job,
+    so deleting the test container/bucket at session teardown is pure waste.
+    Set `CI_PRESERVE_EMULATOR_STATE=0` to force cleanup regardless.
+    """
+    if os.getenv("CI_PRESERVE_EMULATOR_STATE") == "0":
+        return False
+    return urlparse(endpoint_url).hostname in {"127.0.0.1", "localhost", "::1"}
+
+
+def generate_unique_name(prefix: str) -> str:
+    """Generates a unique, compliant bucket/container name."""
+    sanitized_prefix = prefix.lower().replace("_", "-").replace(".", "-")
+    full_name = f"{sanitized_prefix}-{secrets.token_hex(6)}"
+    return full_name[:63].strip("-")
+
+
+@pytest.fixture(scope="session")
+def azure_container_name() -> str:
+    """Provides a single Azure container name shared by the whole session."""
+    return generate_unique_name("cloud-autopkg-test-azure")
+
+
+@pytest.fixture(scope="session")
+def s3_bucket_name() -> str:
+    """Provides a single S3 bucket name shared by the whole session."""
+    return generate_unique_name("cloud-autopkg-test-s3")
+
+
+@pytest.fixture
+def gcs_bucket_name() -> str:
+    """Provides a unique GCS bucket name for each test."""
+    return generate_unique_name("cloud-autopkg-test-gcs")
+
+
+@pytest.fixture(autouse=True)
+def reset_singletons() -> Generator[None, None, None]:
+    """Fixture to reset the singleton instances before each test.
+
+    This ensures that each test gets a clean, independent instance of each singleton,
+    preventing test contamination. The cache plugin singletons are reset alongside
+    `Settings` so that per-test settings (such as a unique cache file name) are
+    picked up by freshly constructed plugins.
+    """
+    yield
+    Settings._instance = None
+    PluginManager._instance = None
+    AsyncAzureBlobCache._instance = None
+    AsyncGCSCache._instance = None
+    AsyncS3Cache._instance = None
+
+
+@pytest.fixture
+def cache_key() -> str:
+    """Provides a unique cache file key for each test.
+
+    Tests share a single session-scoped bucket/container, so each test isolates
+    itself under a unique key prefix rather than a fresh container. Session
+    teardown removes all test keys in one batched pass.
+    """
+    return f"tests/{uuid.uuid4().hex}/metadata_cache.json"
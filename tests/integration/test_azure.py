@@ -1,51 +1,57 @@
+import asyncio
 import contextlib
+import gzip
 import json
 import os
-import time
-import uuid
 from collections.abc import AsyncGenerator
 from datetime import datetime, timezone
 
+import aiohttp
+import orjson
 import pytest
 import pytest_asyncio
 from azure.core.credentials import AzureNamedKeyCredential
 from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+from azure.core.pipeline.transport import AioHttpTransport
 from azure.storage.blob.aio import BlobClient, BlobServiceClient
+from conftest import is_local_emulator
 
-from cloud_autopkg_runner import Settings, get_cache_plugin
+from cloud_autopkg_runner import Settings
+from cloud_autopkg_runner.cache.azure_blob_cache import AsyncAzureBlobCache
 from cloud_autopkg_runner.metadata_cache import RecipeCache
 
 # Define test data outside of a class
 TEST_RECIPE_NAME = "test.pkg.recipe"
 TEST_TIMESTAMP_STR = datetime(2023, 10, 26, 10, 30, 0, tzinfo=timezone.utc).isoformat()
 
+AZURE_ACCOUNT_URL = os.environ.get(
+    "AZURE_ACCOUNT_URL", "https://127.0.0.1:10000/devstoreaccount1"
+)
+AZURITE_ACCOUNT_KEY = (
+    "Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6"
+    "IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw=="
+)
 
-# Fixtures
+# Maximum number of blob names accepted by a single delete_blobs call
+DELETE_BLOBS_BATCH_SIZE = 256
+
+# aiohttp connection pool size for the shared session client; sized
+# explicitly so concurrent test requests never depend on aiohttp's default
+CONNECTION_LIMIT = 64
 
 
-def generate_unique_name(prefix: str) -> str:
-    """Generates a unique, compliant container name."""
-    unique_part = uuid.uuid4().hex[:8]
-    timestamp_part = str(int(time.time()))
-    sanitized_prefix = prefix.lower().replace("_", "-").replace(".", "-")
-    full_name = f"{sanitized_prefix}-{unique_part}-{timestamp_part}"
-    return full_name[:63].strip("-")
+# Fixtures
 
 
 @pytest.fixture
-def settings() -> Settings:
+def settings(azure_container_name: str, cache_key: str) -> Settings:
     """Setup the Settings class."""
     settings = Settings()
     settings.cache_plugin = "azure"
-    settings.cloud_container_name = generate_unique_name("cloud-autopkg-test-azure")
-    settings.cache_file = "metadata_cache.json"
-    settings.azure_account_url = os.environ.get(
-        "AZURE_ACCOUNT_URL", "https://127.0.0.1:10000/devstoreaccount1"
-    )
-
-    yield settings
-
-    Settings._instance = None
+    settings.cloud_container_name = azure_container_name
+    settings.cache_file = cache_key
+    settings.azure_account_url = AZURE_ACCOUNT_URL
+    return settings
 
 
 @pytest.fixture
@@ -64,75 +70,144 @@ def test_data() -> RecipeCache:
     }
 
 
-@pytest_asyncio.fixture
-async def azure_blob_client(settings: Settings) -> AsyncGenerator[BlobClient, None]:
-    """Fixture that provides a valid BlobClient."""
+@pytest_asyncio.fixture(scope="session")
+async def azure_blob_service_client(
+    azure_container_name: str,
+) -> AsyncGenerator[BlobServiceClient, None]:
+    """Fixture that provides a session-wide BlobServiceClient.
+
+    The container is created once per session; tests isolate themselves through
+    unique blob names rather than fresh containers.
+    """
     # Create a credential object that Azurite understands
     azurite_credential = AzureNamedKeyCredential(
-        name="devstoreaccount1",
-        key=(
-            "Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6"
-            "IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw=="
-        ),
+        name="devstoreaccount1", key=AZURITE_ACCOUNT_KEY
     )
 
-    # Use the Azurite-compatible credential to create the BlobServiceClient
-    async with (
-        BlobServiceClient(
-            account_url=settings.azure_account_url, credential=azurite_credential
-        ) as azure_blob_service_client,
-        azure_blob_service_client.get_blob_client(
-            container=settings.cloud_container_name, blob=settings.cache_file
-        ) as blob_client,
-    ):
+    # Use the Azurite-compatible credential to create the BlobServiceClient.
+    # The pool size only takes effect through an explicitly provided session;
+    # session_owner=True hands its cleanup to the transport.
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=CONNECTION_LIMIT)
+    )
+    transport = AioHttpTransport(session=session, session_owner=True)
+    async with BlobServiceClient(
+        account_url=AZURE_ACCOUNT_URL,
+        credential=azurite_credential,
+        transport=transport,
+    ) as azure_blob_service_client:
         with contextlib.suppress(ResourceExistsError):
-            await azure_blob_service_client.create_container(
-                name=settings.cloud_container_name
-            )
+            await azure_blob_service_client.create_container(name=azure_container_name)
+
+        yield azure_blob_service_client
+
+        # Delete test blobs in parallel batches rather than one round-trip per
+        # blob; delete_blobs accepts up to 256 names per call.
+        container_client = azure_blob_service_client.get_container_client(
+            azure_container_name
+        )
+        blob_names = [blob.name async for blob in container_client.list_blobs()]
+        batches = [
+            blob_names[i : i + DELETE_BLOBS_BATCH_SIZE]
+            for i in range(0, len(blob_names), DELETE_BLOBS_BATCH_SIZE)
+        ]
+        await asyncio.gather(
+            *(container_client.delete_blobs(*batch) for batch in batches)
+        )
+
+        # An emulator's containers vanish with the emulator itself, and
+        # Azurite soft-deletes first, making delete_container slower than it
+        # looks; only pay for the round-trip against real storage.
+        if not is_local_emulator(AZURE_ACCOUNT_URL):
+            with contextlib.suppress(ResourceNotFoundError):
+                await azure_blob_service_client.delete_container(
+                    container=azure_container_name
+                )
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def _warm_azure_connection(
+    azure_blob_service_client: BlobServiceClient,
+) -> None:
+    """Issues one throwaway request against the shared service client.
+
+    Pays the DNS resolution and TLS handshake cost once at session startup
+    instead of inside the first test that touches storage.
+    """
+    await azure_blob_service_client.get_service_properties()
 
-        yield blob_client
 
-        with contextlib.suppress(ResourceNotFoundError):
-            await blob_client.delete_blob(delete_snapshots="include")
-            await azure_blob_service_client.delete_container(
-                container=settings.cloud_container_name
-            )
+@pytest.fixture
+def azure_blob_client(
+    azure_blob_service_client: BlobServiceClient, settings: Settings
+) -> BlobClient:
+    """Fixture that provides a BlobClient for the test-specific blob.
+
+    The client shares the session client's transport, so it is not closed here;
+    test blobs are removed with the container at session teardown.
+    """
+    return azure_blob_service_client.get_blob_client(
+        container=settings.cloud_container_name, blob=settings.cache_file
+    )
 
 
 # Tests
 
 
-@pytest.mark.asyncio
 async def test_save_cache_file(
-    azure_blob_client: BlobClient, test_data: RecipeCache
+    azure_blob_service_client: BlobServiceClient,
+    azure_blob_client: BlobClient,
+    test_data: RecipeCache,
 ) -> None:
     """Test writing a cache file to Azure Blob Storage."""
-    # Store with plugin
-    plugin = get_cache_plugin()
+    # Store with plugin, reusing the session client's connection pool
+    plugin = AsyncAzureBlobCache(service_client=azure_blob_service_client)
     async with plugin:
         await plugin.set_item(TEST_RECIPE_NAME, test_data)
 
     expected_content = {TEST_RECIPE_NAME: test_data}
 
-    # Retrieve with standard tooling
-    download_stream = await azure_blob_client.download_blob()
-    content = await download_stream.readall()
-    actual_content = json.loads(content)
+    # Drop the in-memory copy so the plugin readback below re-fetches from
+    # storage through the already-open client instead of a fresh plugin.
+    await plugin.invalidate_local_cache()
+
+    async def _download_all() -> bytes:
+        download_stream = await azure_blob_client.download_blob()
+        content = await download_stream.readall()
+        # The plugin stores the blob gzip-compressed; decompress unless the
+        # transport already did so transparently.
+        if content.startswith(b"\x1f\x8b"):
+            content = gzip.decompress(content)
+        return content
+
+    # Retrieve with the plugin and with standard tooling; the two reads are
+    # independent, so run them concurrently.
+    loaded_item, content = await asyncio.gather(
+        plugin.get_item(TEST_RECIPE_NAME), _download_all()
+    )
+    actual_content = orjson.loads(content)
 
+    assert loaded_item == test_data
     assert actual_content == expected_content
 
 
-@pytest.mark.asyncio
 async def test_retrieve_cache_file(
-    azure_blob_client: BlobClient, test_data: RecipeCache
+    azure_blob_service_client: BlobServiceClient,
+    azure_blob_client: BlobClient,
+    test_data: RecipeCache,
 ) -> None:
     """Test retrieving a cache file from Azure Blob Storage."""
-    # Store with standard tooling
+    plugin = AsyncAzureBlobCache(service_client=azure_blob_service_client)
+
+    # Store with standard tooling; the raw upload and the plugin's client
+    # setup touch disjoint resources, so run them concurrently.
     content = json.dumps({TEST_RECIPE_NAME: test_data})
-    await azure_blob_client.upload_blob(data=content.encode("utf-8"), overwrite=True)
+    await asyncio.gather(
+        azure_blob_client.upload_blob(data=content.encode("utf-8"), overwrite=True),
+        plugin.open(),
+    )
 
-    # Retrieve with plugin
-    plugin = get_cache_plugin()
+    # Retrieve with plugin, reusing the session client's connection pool
     async with plugin:
         actual_content = await plugin.get_item(TEST_RECIPE_NAME)
 
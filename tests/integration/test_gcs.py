@@ -1,7 +1,5 @@
 import asyncio
 import json
-import time
-import uuid
 from collections.abc import AsyncGenerator
 from datetime import datetime, timezone
 
@@ -18,26 +16,14 @@ TEST_TIMESTAMP_STR = datetime(2023, 10, 26, 10, 30, 0, tzinfo=timezone.utc).isof
 # Fixtures
 
 
-def generate_unique_name(prefix: str) -> str:
-    """Generates a unique, compliant bucket name."""
-    unique_part = uuid.uuid4().hex[:8]
-    timestamp_part = str(int(time.time()))
-    sanitized_prefix = prefix.lower().replace("_", "-").replace(".", "-")
-    full_name = f"{sanitized_prefix}-{unique_part}-{timestamp_part}"
-    return full_name[:63].strip("-")
-
-
 @pytest.fixture
-def settings() -> Settings:
+def settings(gcs_bucket_name: str) -> Settings:
     """Setup the Settings class."""
     settings = Settings()
     settings.cache_plugin = "gcs"
-    settings.cloud_container_name = generate_unique_name("cloud-autopkg-test-gcs")
+    settings.cloud_container_name = gcs_bucket_name
     settings.cache_file = "metadata_cache.json"
-
-    yield settings
-
-    Settings._instance = None
+    return settings
 
 
 @pytest.fixture
@@ -74,7 +60,6 @@ async def gcs_client(settings: Settings) -> AsyncGenerator[Client, None]:
 # Tests
 
 
-@pytest.mark.asyncio
 async def test_save_cache_file(
     gcs_client: Client, settings: Settings, test_data: RecipeCache
 ) -> None:
@@ -97,7 +82,6 @@ async def test_save_cache_file(
     assert actual_content == expected_content
 
 
-@pytest.mark.asyncio
 async def test_retrieve_cache_file(
     gcs_client: Client, settings: Settings, test_data: RecipeCache
 ) -> None:
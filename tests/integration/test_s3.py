@@ -1,16 +1,21 @@
+import asyncio
+import gzip
 import json
-import time
-import uuid
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
 from datetime import datetime, timezone
-from typing import Any
 
 import boto3
+import orjson
 import pytest
+import pytest_asyncio
+from botocore.exceptions import ClientError
+from conftest import is_local_emulator
 from types_boto3_s3 import S3Client
+from types_boto3_s3.type_defs import ObjectIdentifierTypeDef
 
 from cloud_autopkg_runner import Settings
-from cloud_autopkg_runner.metadata_cache import RecipeCache, get_cache_plugin
+from cloud_autopkg_runner.cache.s3_cache import AsyncS3Cache
+from cloud_autopkg_runner.metadata_cache import RecipeCache
 
 # Define test data outside of a class
 TEST_RECIPE_NAME = "test.pkg.recipe"
@@ -20,26 +25,14 @@ TEST_TIMESTAMP_STR = datetime(2023, 10, 26, 10, 30, 0, tzinfo=timezone.utc).isof
 # Fixtures
 
 
-def generate_unique_name(prefix: str) -> str:
-    """Generates a unique, compliant bucket name."""
-    unique_part = uuid.uuid4().hex[:8]
-    timestamp_part = str(int(time.time()))
-    sanitized_prefix = prefix.lower().replace("_", "-").replace(".", "-")
-    full_name = f"{sanitized_prefix}-{unique_part}-{timestamp_part}"
-    return full_name[:63].strip("-")
-
-
 @pytest.fixture
-def settings() -> Settings:
+def settings(s3_bucket_name: str, cache_key: str) -> Settings:
     """Setup the Settings class."""
     settings = Settings()
     settings.cache_plugin = "s3"
-    settings.cloud_container_name = generate_unique_name("cloud-autopkg-test-s3")
-    settings.cache_file = "metadata_cache.json"
-
-    yield settings
-
-    Settings._instance = None
+    settings.cloud_container_name = s3_bucket_name
+    settings.cache_file = cache_key
+    return settings
 
 
 @pytest.fixture
@@ -58,63 +51,147 @@ def test_data() -> RecipeCache:
     }
 
 
-@pytest.fixture
-def s3_client(settings: Settings) -> Generator[S3Client, Any, None]:
-    """Fixture that provides a valid S3Client."""
+async def _wait_for_bucket(s3_client: S3Client, bucket_name: str) -> None:
+    """Polls head_bucket with a short backoff until a new bucket is visible.
+
+    Avoids a fixed post-create sleep; against a local emulator the bucket is
+    usually visible on the first probe.
+    """
+
+    def _bucket_exists() -> bool:
+        try:
+            s3_client.head_bucket(Bucket=bucket_name)
+        except ClientError:
+            return False
+        return True
+
+    for delay in (0.005, 0.01, 0.02, 0.05, 0.1, 0.25):
+        if await asyncio.to_thread(_bucket_exists):
+            return
+        await asyncio.sleep(delay)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def s3_client(s3_bucket_name: str) -> AsyncGenerator[S3Client, None]:
+    """Fixture that provides a session-wide S3Client.
+
+    The bucket is created once per session; tests isolate themselves through
+    unique object keys rather than fresh buckets. Teardown deletes all test
+    objects in concurrent batches before removing the bucket.
+    """
+
+    def _list_key_batches() -> list[list[ObjectIdentifierTypeDef]]:
+        # A test bucket holds a handful of objects, so one list_objects_v2
+        # call covers it without constructing a paginator; fall back to the
+        # paginator only if the listing is truncated.
+        response = s3_client.list_objects_v2(Bucket=s3_bucket_name, MaxKeys=1000)
+        if not response.get("IsTruncated"):
+            return [[{"Key": obj["Key"]} for obj in response.get("Contents", [])]]
+
+        paginator = s3_client.get_paginator("list_objects_v2")
+        return [
+            [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+            for page in paginator.paginate(Bucket=s3_bucket_name)
+        ]
+
     session = boto3.Session()
     s3_client: S3Client = session.client("s3")
     try:
-        s3_client.create_bucket(Bucket=settings.cloud_container_name)
+        await asyncio.to_thread(s3_client.create_bucket, Bucket=s3_bucket_name)
+        await _wait_for_bucket(s3_client, s3_bucket_name)
 
         yield s3_client
 
-        s3_client.delete_object(
-            Bucket=settings.cloud_container_name, Key=settings.cache_file
+        key_batches = await asyncio.to_thread(_list_key_batches)
+        await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    s3_client.delete_objects,
+                    Bucket=s3_bucket_name,
+                    Delete={"Objects": keys},
+                )
+                for keys in key_batches
+                if keys
+            )
         )
-        s3_client.delete_bucket(Bucket=settings.cloud_container_name)
+        # An emulator's buckets vanish with the emulator itself; only pay for
+        # the delete_bucket round-trip against real storage.
+        if not is_local_emulator(s3_client.meta.endpoint_url):
+            await asyncio.to_thread(s3_client.delete_bucket, Bucket=s3_bucket_name)
     finally:
         s3_client.close()
 
 
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def _warm_s3_connection(s3_client: S3Client) -> None:
+    """Issues one throwaway request against the shared S3 client.
+
+    Pays the DNS resolution and TLS handshake cost once at session startup
+    instead of inside the first test that touches storage.
+    """
+    await asyncio.to_thread(s3_client.list_buckets)
+
+
 # Tests
 
 
-@pytest.mark.asyncio
 async def test_save_cache_file(
     s3_client: S3Client, settings: Settings, test_data: RecipeCache
 ) -> None:
     """Test writing a cache file to AWS S3."""
-    # Store with plugin
-    plugin = get_cache_plugin()
+    # Store with plugin, reusing the session client's connection pool
+    plugin = AsyncS3Cache(client=s3_client)
     async with plugin:
         await plugin.set_item(TEST_RECIPE_NAME, test_data)
         await plugin.save()
 
     expected_content = {TEST_RECIPE_NAME: test_data}
 
-    # Retrieve with standard tooling
-    response = s3_client.get_object(
-        Bucket=settings.cloud_container_name, Key=settings.cache_file
+    # Drop the in-memory copy so the plugin readback below re-fetches from
+    # storage through the already-open client instead of a fresh plugin.
+    await plugin.invalidate_local_cache()
+
+    # Retrieve with the plugin and with standard tooling; the two reads are
+    # independent, so run them concurrently.
+    loaded_item, response = await asyncio.gather(
+        plugin.get_item(TEST_RECIPE_NAME),
+        asyncio.to_thread(
+            s3_client.get_object,
+            Bucket=settings.cloud_container_name,
+            Key=settings.cache_file,
+        ),
     )
     content = response["Body"].read()
-    actual_content = json.loads(content.decode("utf-8"))
+    # The plugin stores the object gzip-compressed; decompress unless the
+    # transport already did so transparently.
+    if content.startswith(b"\x1f\x8b"):
+        content = gzip.decompress(content)
+    actual_content = orjson.loads(content)
 
+    assert loaded_item == test_data
     assert actual_content == expected_content
 
 
-@pytest.mark.asyncio
 async def test_retrieve_cache_file(
     s3_client: S3Client, settings: Settings, test_data: RecipeCache
 ) -> None:
     """Test retrieving a cache file from AWS S3."""
-    # Store with standard tooling
+    plugin = AsyncS3Cache(client=s3_client)
+
+    # Store with standard tooling; the raw upload and the plugin's client
+    # setup touch disjoint resources, so run them concurrently.
     content = json.dumps({TEST_RECIPE_NAME: test_data})
-    s3_client.put_object(
-        Bucket=settings.cloud_container_name, Key=settings.cache_file, Body=content
+    await asyncio.gather(
+        asyncio.to_thread(
+            s3_client.put_object,
+            Bucket=settings.cloud_container_name,
+            Key=settings.cache_file,
+            Body=content,
+        ),
+        plugin.open(),
     )
 
-    # Retrieve with plugin
-    plugin = get_cache_plugin()
+    # Retrieve with plugin, reusing the session client's connection pool
     async with plugin:
         actual_content = await plugin.get_item(TEST_RECIPE_NAME)
 
@@ -1,12 +1,18 @@
+import gzip
 import json
 from collections.abc import Generator
 from typing import TYPE_CHECKING, Any
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import msgpack
 import pytest
 import pytest_asyncio
 
-from cloud_autopkg_runner.cache.azure_blob_cache import AsyncAzureBlobCache, BlobClient
+from cloud_autopkg_runner.cache.azure_blob_cache import (
+    AsyncAzureBlobCache,
+    BlobClient,
+    _is_emulator,
+)
 from cloud_autopkg_runner.settings import Settings
 
 if TYPE_CHECKING:
@@ -32,7 +38,6 @@ async def azure_cache() -> Generator[AsyncAzureBlobCache, Any, None]:
         await cache.close()
 
 
-@pytest.mark.asyncio
 async def test_load_cache_invalid_json(
     azure_cache: AsyncAzureBlobCache,
 ) -> None:
@@ -50,7 +55,6 @@ async def test_load_cache_invalid_json(
     azure_cache._client.download_blob.return_value.readall.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_load_cache_skips_if_already_loaded(
     azure_cache: AsyncAzureBlobCache,
 ) -> None:
@@ -64,20 +68,33 @@ async def test_load_cache_skips_if_already_loaded(
         assert data == {"recipe1": {"timestamp": "test"}}
 
 
-@pytest.mark.asyncio
+async def test_load_cache_gzipped(azure_cache: AsyncAzureBlobCache) -> None:
+    """Test loading a gzip-compressed cache blob from Azure Blob Storage."""
+    azure_cache._client.download_blob.return_value = AsyncMock()
+    azure_cache._client.download_blob.return_value.readall.return_value = gzip.compress(
+        json.dumps({"recipe1": {"timestamp": "test"}}).encode("utf-8")
+    )
+
+    cache_data = await azure_cache.load()
+
+    assert cache_data == {"recipe1": {"timestamp": "test"}}
+
+
 async def test_save_cache_success(azure_cache: AsyncAzureBlobCache) -> None:
     """Test saving the cache successfully to Azure Blob Storage."""
     azure_cache._cache_data = {"recipe1": {"timestamp": "test"}}
 
     await azure_cache.save()
 
-    azure_cache._client.upload_blob.assert_called_once_with(
-        json.dumps({"recipe1": {"timestamp": "test"}}, indent=4).encode("utf-8"),
-        overwrite=True,
-    )
+    azure_cache._client.upload_blob.assert_called_once()
+    args, kwargs = azure_cache._client.upload_blob.call_args
+    assert gzip.decompress(args[0]) == json.dumps(
+        {"recipe1": {"timestamp": "test"}}, indent=4
+    ).encode("utf-8")
+    assert kwargs["overwrite"] is True
+    assert kwargs["content_settings"].content_encoding == "gzip"
 
 
-@pytest.mark.asyncio
 async def test_save_cache_handles_upload_failure(
     azure_cache: AsyncAzureBlobCache,
 ) -> None:
@@ -100,7 +117,6 @@ async def test_save_cache_handles_upload_failure(
         )
 
 
-@pytest.mark.asyncio
 async def test_save_cache_no_double_load(azure_cache: AsyncAzureBlobCache) -> None:
     """Test that save does not trigger load if already loaded."""
     azure_cache._is_loaded = True
@@ -109,7 +125,6 @@ async def test_save_cache_no_double_load(azure_cache: AsyncAzureBlobCache) -> No
         mock_load.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_get_item(azure_cache: AsyncAzureBlobCache) -> None:
     """Test getting an item from the cache."""
     azure_cache._client.download_blob.return_value = AsyncMock()
@@ -124,7 +139,6 @@ async def test_get_item(azure_cache: AsyncAzureBlobCache) -> None:
     assert item == recipe_cache
 
 
-@pytest.mark.asyncio
 async def test_get_item_calls_load_if_not_loaded(
     azure_cache: AsyncAzureBlobCache,
 ) -> None:
@@ -135,7 +149,6 @@ async def test_get_item_calls_load_if_not_loaded(
         mock_load.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_item_returns_none_if_key_not_found(
     azure_cache: AsyncAzureBlobCache,
 ) -> None:
@@ -146,7 +159,6 @@ async def test_get_item_returns_none_if_key_not_found(
     assert item is None
 
 
-@pytest.mark.asyncio
 async def test_set_item(
     azure_cache: AsyncAzureBlobCache,
 ) -> None:
@@ -158,7 +170,6 @@ async def test_set_item(
     assert azure_cache._cache_data["recipe1"] == recipe_cache
 
 
-@pytest.mark.asyncio
 async def test_delete_item(
     azure_cache: AsyncAzureBlobCache,
 ) -> None:
@@ -171,7 +182,6 @@ async def test_delete_item(
     assert "recipe1" not in azure_cache._cache_data
 
 
-@pytest.mark.asyncio
 async def test_delete_non_existent_key(azure_cache: AsyncAzureBlobCache) -> None:
     """Test that delete_item() does not throw if the key does not exist."""
     azure_cache._is_loaded = True
@@ -180,7 +190,6 @@ async def test_delete_non_existent_key(azure_cache: AsyncAzureBlobCache) -> None
     assert "recipe1" in azure_cache._cache_data
 
 
-@pytest.mark.asyncio
 async def test_clear_cache(azure_cache: AsyncAzureBlobCache) -> None:
     """Test clearing the cache."""
     azure_cache._client.download_blob.return_value = AsyncMock()
@@ -198,14 +207,154 @@ async def test_clear_cache(azure_cache: AsyncAzureBlobCache) -> None:
     assert azure_cache._cache_data == {}
 
     # Check if the upload_blob was called to save the empty cache.
-    azure_cache._client.upload_blob.assert_called_once_with(
-        json.dumps({}, indent=4).encode("utf-8"),
-        overwrite=True,
-    )
+    azure_cache._client.upload_blob.assert_called_once()
+    args, kwargs = azure_cache._client.upload_blob.call_args
+    assert gzip.decompress(args[0]) == json.dumps({}, indent=4).encode("utf-8")
+    assert kwargs["overwrite"] is True
 
 
-@pytest.mark.asyncio
 async def test_close(azure_cache: AsyncAzureBlobCache) -> None:
     """Test that `self._client` does not exist after closing."""
     await azure_cache.close()
     assert not hasattr(azure_cache, "_client")
+
+
+async def test_open_with_injected_service_client() -> None:
+    """Test that open() reuses an externally provided service client."""
+    with (
+        patch.object(Settings, "_instance", None),
+        patch.object(AsyncAzureBlobCache, "_instance", None),
+    ):
+        settings = Settings()
+        settings.azure_account_url = "https://testaccount.blob.core.windows.net"
+        settings.cloud_container_name = "test-container"
+        settings.cache_file = "metadata_cache.json"
+
+        service_client = MagicMock()
+        service_client.get_blob_client.return_value = AsyncMock(spec=BlobClient)
+
+        cache = AsyncAzureBlobCache(service_client=service_client)
+        await cache.open()
+
+        service_client.get_blob_client.assert_called_once_with(
+            container="test-container", blob="metadata_cache.json"
+        )
+        assert not hasattr(cache, "_credential")
+
+
+async def test_close_leaves_injected_service_client_open() -> None:
+    """Test that close() does not close an externally provided service client."""
+    with (
+        patch.object(Settings, "_instance", None),
+        patch.object(AsyncAzureBlobCache, "_instance", None),
+    ):
+        settings = Settings()
+        settings.azure_account_url = "https://testaccount.blob.core.windows.net"
+        settings.cloud_container_name = "test-container"
+        settings.cache_file = "metadata_cache.json"
+
+        service_client = MagicMock()
+        blob_client = AsyncMock(spec=BlobClient)
+        service_client.get_blob_client.return_value = blob_client
+
+        cache = AsyncAzureBlobCache(service_client=service_client)
+        await cache.open()
+        await cache.close()
+
+        blob_client.close.assert_not_called()
+        service_client.close.assert_not_called()
+
+
+async def test_open_sizes_connection_pool_to_max_concurrency() -> None:
+    """Test that open() builds an aiohttp session sized to max_concurrency."""
+    with (
+        patch.object(Settings, "_instance", None),
+        patch.object(AsyncAzureBlobCache, "_instance", None),
+        patch("cloud_autopkg_runner.cache.azure_blob_cache.aiohttp") as mock_aiohttp,
+        patch(
+            "cloud_autopkg_runner.cache.azure_blob_cache.AioHttpTransport"
+        ) as mock_transport,
+        patch(
+            "cloud_autopkg_runner.cache.azure_blob_cache.BlobServiceClient"
+        ) as mock_service_client,
+    ):
+        settings = Settings()
+        settings.azure_account_url = "https://testaccount.blob.core.windows.net"
+        settings.cloud_container_name = "test-container"
+        settings.cache_file = "metadata_cache.json"
+        settings.max_concurrency = 32
+
+        cache = AsyncAzureBlobCache()
+        await cache.open()
+
+        mock_aiohttp.TCPConnector.assert_called_once_with(limit=32)
+        mock_aiohttp.ClientSession.assert_called_once_with(
+            connector=mock_aiohttp.TCPConnector.return_value
+        )
+        mock_transport.assert_called_once_with(
+            session=mock_aiohttp.ClientSession.return_value, session_owner=True
+        )
+        assert (
+            mock_service_client.call_args.kwargs["transport"]
+            is mock_transport.return_value
+        )
+
+
+@pytest.mark.parametrize(
+    ("account_url", "expected"),
+    [
+        ("https://127.0.0.1:10000/devstoreaccount1", True),
+        ("http://localhost:10000/devstoreaccount1", True),
+        ("https://testaccount.blob.core.windows.net", False),
+    ],
+)
+def test_is_emulator_detects_local_hosts(account_url: str, expected: bool) -> None:
+    """Test that _is_emulator recognizes local emulator endpoints."""
+    assert _is_emulator(account_url) is expected
+
+
+def test_is_emulator_env_override(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that AZURE_STORAGE_EMULATOR forces emulator mode."""
+    monkeypatch.setenv("AZURE_STORAGE_EMULATOR", "1")
+    assert _is_emulator("https://testaccount.blob.core.windows.net") is True
+
+
+async def test_save_and_load_msgpack_format() -> None:
+    """Test that a .msgpack blob name round-trips through MessagePack."""
+    with (
+        patch.object(Settings, "_instance", None),
+        patch.object(AsyncAzureBlobCache, "_instance", None),
+    ):
+        settings = Settings()
+        settings.azure_account_url = "https://testaccount.blob.core.windows.net"
+        settings.cloud_container_name = "test-container"
+        settings.cache_file = "metadata_cache.msgpack"
+
+        cache = AsyncAzureBlobCache()
+        cache._client = AsyncMock(spec=BlobClient)
+        cache._cache_data = {"recipe1": {"timestamp": "test"}}
+
+        await cache.save()
+
+        args, kwargs = cache._client.upload_blob.call_args
+        assert kwargs["content_settings"].content_type == "application/msgpack"
+        payload = gzip.decompress(args[0])
+        assert msgpack.unpackb(payload, raw=False) == {"recipe1": {"timestamp": "test"}}
+
+        cache._client.download_blob.return_value = AsyncMock()
+        cache._client.download_blob.return_value.readall.return_value = args[0]
+        cache._cache_data = {}
+        cache._is_loaded = False
+
+        assert await cache.load() == {"recipe1": {"timestamp": "test"}}
+
+
+async def test_invalidate_local_cache(azure_cache: AsyncAzureBlobCache) -> None:
+    """Test that invalidate_local_cache forces a reload on the next read."""
+    azure_cache._cache_data = {"recipe1": {"timestamp": "test"}}
+    azure_cache._is_loaded = True
+
+    await azure_cache.invalidate_local_cache()
+
+    assert azure_cache._cache_data == {}
+    assert azure_cache._is_loaded is False
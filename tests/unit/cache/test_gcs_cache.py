@@ -3,7 +3,6 @@ from collections.abc import Generator
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
 import pytest_asyncio
 from google.cloud.storage import (  # pyright: ignore[reportMissingTypeStubs]
     Blob,
@@ -40,7 +39,6 @@ async def gcs_cache() -> Generator[AsyncGCSCache, Any, None]:
         await cache.close()
 
 
-@pytest.mark.asyncio
 async def test_load_cache_success(gcs_cache: AsyncGCSCache) -> None:
     """Test loading the cache successfully from S3."""
     cache_data = await gcs_cache.load()
@@ -53,7 +51,6 @@ async def test_load_cache_success(gcs_cache: AsyncGCSCache) -> None:
     gcs_cache._client.bucket().blob().download_as_bytes.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_load_cache_invalid_json(gcs_cache: AsyncGCSCache) -> None:
     """Test loading the cache when the JSON is invalid."""
     gcs_cache._client.bucket.return_value = MagicMock(
@@ -66,7 +63,6 @@ async def test_load_cache_invalid_json(gcs_cache: AsyncGCSCache) -> None:
     assert gcs_cache._is_loaded is True
 
 
-@pytest.mark.asyncio
 async def test_load_cache_skips_if_already_loaded(gcs_cache: AsyncGCSCache) -> None:
     """Test that load() does not call S3 if already loaded."""
     gcs_cache._is_loaded = True
@@ -77,7 +73,6 @@ async def test_load_cache_skips_if_already_loaded(gcs_cache: AsyncGCSCache) -> N
     assert data == {"recipe1": {"timestamp": "test"}}
 
 
-@pytest.mark.asyncio
 async def test_save_cache_success(gcs_cache: AsyncGCSCache) -> None:
     """Test saving the cache successfully to S3."""
     content = {"recipe1": {"timestamp": "test"}}
@@ -92,7 +87,6 @@ async def test_save_cache_success(gcs_cache: AsyncGCSCache) -> None:
     )
 
 
-@pytest.mark.asyncio
 async def test_save_cache_handles_upload_failure(gcs_cache: AsyncGCSCache) -> None:
     """Test that save handles upload failure gracefully."""
     with (
@@ -111,7 +105,6 @@ async def test_save_cache_handles_upload_failure(gcs_cache: AsyncGCSCache) -> No
         )
 
 
-@pytest.mark.asyncio
 async def test_clear_cache(gcs_cache: AsyncGCSCache) -> None:
     """Test clearing the cache."""
     await gcs_cache.clear_cache()
@@ -122,14 +115,12 @@ async def test_clear_cache(gcs_cache: AsyncGCSCache) -> None:
     )
 
 
-@pytest.mark.asyncio
 async def test_get_item(gcs_cache: AsyncGCSCache) -> None:
     """Test getting an item from the cache."""
     item = await gcs_cache.get_item("recipe1")
     assert item == {"timestamp": "test"}
 
 
-@pytest.mark.asyncio
 async def test_get_item_calls_load_if_not_loaded(gcs_cache: AsyncGCSCache) -> None:
     """Test that get_item() triggers load() if the cache is not loaded."""
     gcs_cache._is_loaded = False
@@ -138,7 +129,6 @@ async def test_get_item_calls_load_if_not_loaded(gcs_cache: AsyncGCSCache) -> No
         mock_load.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_item_returns_none_if_key_not_found(gcs_cache: AsyncGCSCache) -> None:
     """Test that get_item() returns None if the key is not found."""
     gcs_cache._is_loaded = True
@@ -147,7 +137,6 @@ async def test_get_item_returns_none_if_key_not_found(gcs_cache: AsyncGCSCache)
     assert item is None
 
 
-@pytest.mark.asyncio
 async def test_set_item(gcs_cache: AsyncGCSCache) -> None:
     """Test setting an item in the cache."""
     await gcs_cache.load()
@@ -157,7 +146,6 @@ async def test_set_item(gcs_cache: AsyncGCSCache) -> None:
     assert gcs_cache._cache_data["recipe1"] == {"timestamp": "test"}
 
 
-@pytest.mark.asyncio
 async def test_delete_item(gcs_cache: AsyncGCSCache) -> None:
     """Test deleting an item from the cache."""
     await gcs_cache.load()
@@ -168,7 +156,6 @@ async def test_delete_item(gcs_cache: AsyncGCSCache) -> None:
     assert "recipe1" not in gcs_cache._cache_data
 
 
-@pytest.mark.asyncio
 async def test_delete_non_existent_key(gcs_cache: AsyncGCSCache) -> None:
     """Test that delete_item() does not throw if the key does not exist."""
     gcs_cache._is_loaded = True
@@ -177,8 +164,18 @@ async def test_delete_non_existent_key(gcs_cache: AsyncGCSCache) -> None:
     assert "recipe1" in gcs_cache._cache_data
 
 
-@pytest.mark.asyncio
 async def test_close(gcs_cache: AsyncGCSCache) -> None:
     """Test that `self._client` does not exist after closing."""
     await gcs_cache.close()
     assert not hasattr(gcs_cache, "_client")
+
+
+async def test_invalidate_local_cache(gcs_cache: AsyncGCSCache) -> None:
+    """Test that invalidate_local_cache forces a reload on the next read."""
+    gcs_cache._cache_data = {"recipe1": {"timestamp": "test"}}
+    gcs_cache._is_loaded = True
+
+    await gcs_cache.invalidate_local_cache()
+
+    assert gcs_cache._cache_data == {}
+    assert gcs_cache._is_loaded is False
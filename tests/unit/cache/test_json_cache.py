@@ -4,7 +4,6 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import patch
 
-import pytest
 import pytest_asyncio
 
 from cloud_autopkg_runner import Settings
@@ -29,7 +28,6 @@ async def json_cache(tmp_path: Path) -> Generator[AsyncJsonFileCache, Any, None]
         await cache.close()
 
 
-@pytest.mark.asyncio
 async def test_load_cache_success(json_cache: AsyncJsonFileCache) -> None:
     """Test loading the cache successfully."""
     cache_data = await json_cache.load()
@@ -38,7 +36,6 @@ async def test_load_cache_success(json_cache: AsyncJsonFileCache) -> None:
     assert json_cache._is_loaded is True
 
 
-@pytest.mark.asyncio
 async def test_load_cache_missing_file(json_cache: AsyncJsonFileCache) -> None:
     """Test loading the cache when the key does not exist."""
     json_cache._file_path.unlink()
@@ -49,7 +46,6 @@ async def test_load_cache_missing_file(json_cache: AsyncJsonFileCache) -> None:
     assert json_cache._is_loaded is True
 
 
-@pytest.mark.asyncio
 async def test_load_cache_invalid_json(json_cache: AsyncJsonFileCache) -> None:
     """Test loading the cache when the JSON is invalid."""
     json_cache._file_path.write_text("invalid json")
@@ -60,7 +56,6 @@ async def test_load_cache_invalid_json(json_cache: AsyncJsonFileCache) -> None:
     assert json_cache._is_loaded is True
 
 
-@pytest.mark.asyncio
 async def test_load_cache_skips_read_if_already_loaded(
     json_cache: AsyncJsonFileCache,
 ) -> None:
@@ -76,7 +71,6 @@ async def test_load_cache_skips_read_if_already_loaded(
         mock_read_text.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_save_cache_success(json_cache: AsyncJsonFileCache) -> None:
     """Test saving the cache successfully."""
     json_cache._cache_data = {"recipe1": {"timestamp": "test"}}
@@ -89,7 +83,6 @@ async def test_save_cache_success(json_cache: AsyncJsonFileCache) -> None:
     assert file_data == json.dumps({"recipe1": {"timestamp": "test"}}, indent=4)
 
 
-@pytest.mark.asyncio
 async def test_save_cache_handles_failure(json_cache: AsyncJsonFileCache) -> None:
     """Test that save handles failure gracefully."""
     with (
@@ -105,7 +98,6 @@ async def test_save_cache_handles_failure(json_cache: AsyncJsonFileCache) -> Non
         )
 
 
-@pytest.mark.asyncio
 async def test_clear_cache(json_cache: AsyncJsonFileCache) -> None:
     """Test clearing the cache."""
     json_cache._cache_data = {"recipe1": {"timestamp": "test"}}
@@ -120,7 +112,6 @@ async def test_clear_cache(json_cache: AsyncJsonFileCache) -> None:
         mock_write_text.assert_called_once_with(json.dumps({}, indent=4))
 
 
-@pytest.mark.asyncio
 async def test_get_item(json_cache: AsyncJsonFileCache) -> None:
     """Test getting an item from the cache."""
     await json_cache.load()
@@ -128,7 +119,6 @@ async def test_get_item(json_cache: AsyncJsonFileCache) -> None:
     assert item == {"timestamp": "test"}
 
 
-@pytest.mark.asyncio
 async def test_get_item_calls_load_if_not_loaded(
     json_cache: AsyncJsonFileCache,
 ) -> None:
@@ -139,7 +129,6 @@ async def test_get_item_calls_load_if_not_loaded(
         mock_load.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_item_returns_none_if_key_not_found(
     json_cache: AsyncJsonFileCache,
 ) -> None:
@@ -150,7 +139,6 @@ async def test_get_item_returns_none_if_key_not_found(
     assert item is None
 
 
-@pytest.mark.asyncio
 async def test_set_item(json_cache: AsyncJsonFileCache) -> None:
     """Test setting an item in the cache."""
     await json_cache.load()
@@ -160,7 +148,6 @@ async def test_set_item(json_cache: AsyncJsonFileCache) -> None:
     assert json_cache._cache_data["recipe1"] == {"timestamp": "test"}
 
 
-@pytest.mark.asyncio
 async def test_delete_item(json_cache: AsyncJsonFileCache) -> None:
     """Test deleting an item from the cache."""
     await json_cache.load()
@@ -171,10 +158,20 @@ async def test_delete_item(json_cache: AsyncJsonFileCache) -> None:
     assert "recipe1" not in json_cache._cache_data
 
 
-@pytest.mark.asyncio
 async def test_delete_non_existent_key(json_cache: AsyncJsonFileCache) -> None:
     """Test that delete_item() does not throw if the key does not exist."""
     json_cache._is_loaded = True
     json_cache._cache_data = {"recipe1": {"timestamp": "test"}}
     await json_cache.delete_item("non_existent_key")  # Should not raise an error
     assert "recipe1" in json_cache._cache_data
+
+
+async def test_invalidate_local_cache(json_cache: AsyncJsonFileCache) -> None:
+    """Test that invalidate_local_cache forces a reload on the next read."""
+    json_cache._cache_data = {"recipe1": {"timestamp": "test"}}
+    json_cache._is_loaded = True
+
+    await json_cache.invalidate_local_cache()
+
+    assert json_cache._cache_data == {}
+    assert json_cache._is_loaded is False
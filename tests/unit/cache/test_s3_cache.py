@@ -1,10 +1,11 @@
 import asyncio
+import gzip
 import json
 from collections.abc import Generator
 from typing import Any
 from unittest.mock import MagicMock, patch
 
-import pytest
+import msgpack
 import pytest_asyncio
 from botocore.exceptions import ClientError
 
@@ -32,7 +33,6 @@ async def s3_cache() -> Generator[AsyncS3Cache, Any, None]:
             await cache.close()
 
 
-@pytest.mark.asyncio
 async def test_load_cache_success(s3_cache: AsyncS3Cache) -> None:
     """Test loading the cache successfully from S3."""
     mock_body = MagicMock()
@@ -48,7 +48,31 @@ async def test_load_cache_success(s3_cache: AsyncS3Cache) -> None:
     )
 
 
-@pytest.mark.asyncio
+async def test_load_cache_gzipped(s3_cache: AsyncS3Cache) -> None:
+    """Test loading a gzip-compressed cache object from S3."""
+    mock_body = MagicMock()
+    mock_body.read.return_value = gzip.compress(
+        b'{"recipe1": {"timestamp": "test", "metadata": []}}'
+    )
+
+    s3_cache._client.get_object.return_value = {"Body": mock_body}
+    cache_data = await s3_cache.load()
+
+    assert cache_data == {"recipe1": {"timestamp": "test", "metadata": []}}
+
+
+async def test_load_cache_corrupt_gzip(s3_cache: AsyncS3Cache) -> None:
+    """Test that a truncated gzip object initializes an empty cache."""
+    mock_body = MagicMock()
+    mock_body.read.return_value = b"\x1f\x8b\x08\x00corrupt"
+
+    s3_cache._client.get_object.return_value = {"Body": mock_body}
+    cache_data = await s3_cache.load()
+
+    assert cache_data == {}
+    assert s3_cache._is_loaded is True
+
+
 async def test_load_cache_no_such_key(s3_cache: AsyncS3Cache) -> None:
     """Test loading the cache when the key does not exist in S3."""
     # Create a mock response that mimics the structure of a NoSuchKey error
@@ -80,7 +104,6 @@ async def test_load_cache_no_such_key(s3_cache: AsyncS3Cache) -> None:
     assert s3_cache._is_loaded is True
 
 
-@pytest.mark.asyncio
 async def test_load_cache_invalid_json(s3_cache: AsyncS3Cache) -> None:
     """Test loading the cache when the JSON is invalid."""
     mock_body = MagicMock()
@@ -93,7 +116,6 @@ async def test_load_cache_invalid_json(s3_cache: AsyncS3Cache) -> None:
     assert s3_cache._is_loaded is True
 
 
-@pytest.mark.asyncio
 async def test_load_cache_skips_if_already_loaded(s3_cache: AsyncS3Cache) -> None:
     """Test that load() does not call S3 if already loaded."""
     s3_cache._is_loaded = True
@@ -105,21 +127,22 @@ async def test_load_cache_skips_if_already_loaded(s3_cache: AsyncS3Cache) -> Non
         assert data == {"recipe1": {"timestamp": "test"}}
 
 
-@pytest.mark.asyncio
 async def test_save_cache_success(s3_cache: AsyncS3Cache) -> None:
     """Test saving the cache successfully to S3."""
     s3_cache._cache_data = {"recipe1": {"timestamp": "test"}}
 
     await s3_cache.save()
 
-    s3_cache._client.put_object.assert_called_once_with(
-        Bucket="test-bucket",
-        Key="metadata_cache.json",
-        Body=json.dumps({"recipe1": {"timestamp": "test"}}, indent=4).encode("utf-8"),
-    )
+    s3_cache._client.put_object.assert_called_once()
+    _args, kwargs = s3_cache._client.put_object.call_args
+    assert kwargs["Bucket"] == "test-bucket"
+    assert kwargs["Key"] == "metadata_cache.json"
+    assert kwargs["ContentEncoding"] == "gzip"
+    assert gzip.decompress(kwargs["Body"]) == json.dumps(
+        {"recipe1": {"timestamp": "test"}}, indent=4
+    ).encode("utf-8")
 
 
-@pytest.mark.asyncio
 async def test_save_cache_handles_upload_failure(s3_cache: AsyncS3Cache) -> None:
     """Test that save() handles upload failure gracefully."""
     s3_cache._client.put_object.side_effect = ClientError(
@@ -137,7 +160,6 @@ async def test_save_cache_handles_upload_failure(s3_cache: AsyncS3Cache) -> None
         )
 
 
-@pytest.mark.asyncio
 async def test_clear_cache(s3_cache: AsyncS3Cache) -> None:
     """Test clearing the cache."""
     s3_cache._cache_data = {"recipe1": {"timestamp": "test"}}
@@ -150,10 +172,9 @@ async def test_clear_cache(s3_cache: AsyncS3Cache) -> None:
     _args, kwargs = s3_cache._client.put_object.call_args
     assert kwargs["Bucket"] == "test-bucket"
     assert kwargs["Key"] == "metadata_cache.json"
-    assert json.loads(kwargs["Body"].decode()) == {}
+    assert json.loads(gzip.decompress(kwargs["Body"])) == {}
 
 
-@pytest.mark.asyncio
 async def test_get_item(s3_cache: AsyncS3Cache) -> None:
     """Test getting an item from the cache."""
     s3_cache._is_loaded = True
@@ -163,7 +184,6 @@ async def test_get_item(s3_cache: AsyncS3Cache) -> None:
     assert item == {"timestamp": "test", "metadata": []}
 
 
-@pytest.mark.asyncio
 async def test_get_item_triggers_load_if_not_loaded(s3_cache: AsyncS3Cache) -> None:
     """Test that get_item() triggers load() if the cache is not loaded."""
     s3_cache._is_loaded = False
@@ -173,7 +193,6 @@ async def test_get_item_triggers_load_if_not_loaded(s3_cache: AsyncS3Cache) -> N
         mock_load.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_item_returns_none_if_missing(s3_cache: AsyncS3Cache) -> None:
     """Test that get_item() returns None if the key is not found."""
     s3_cache._is_loaded = True
@@ -181,7 +200,6 @@ async def test_get_item_returns_none_if_missing(s3_cache: AsyncS3Cache) -> None:
     assert await s3_cache.get_item("non_existent") is None
 
 
-@pytest.mark.asyncio
 async def test_set_item(s3_cache: AsyncS3Cache) -> None:
     """Test setting an item in the cache."""
     mock_body = MagicMock()
@@ -195,7 +213,6 @@ async def test_set_item(s3_cache: AsyncS3Cache) -> None:
     assert s3_cache._cache_data["recipe1"] == {"timestamp": "test"}
 
 
-@pytest.mark.asyncio
 async def test_delete_item(s3_cache: AsyncS3Cache) -> None:
     """Test deleting an item from the cache."""
     s3_cache._cache_data = {"recipe1": {"timestamp": "test"}}
@@ -205,7 +222,6 @@ async def test_delete_item(s3_cache: AsyncS3Cache) -> None:
     assert "recipe1" not in s3_cache._cache_data
 
 
-@pytest.mark.asyncio
 async def test_delete_non_existent_key(s3_cache: AsyncS3Cache) -> None:
     """Test that delete_item() does not raise if the key does not exist."""
     s3_cache._is_loaded = True
@@ -214,8 +230,84 @@ async def test_delete_non_existent_key(s3_cache: AsyncS3Cache) -> None:
     assert "recipe1" in s3_cache._cache_data
 
 
-@pytest.mark.asyncio
 async def test_close_removes_client(s3_cache: AsyncS3Cache) -> None:
     """Test that close() deletes the S3 client."""
     await s3_cache.close()
     assert not hasattr(s3_cache, "_client")
+
+
+async def test_open_with_injected_client() -> None:
+    """Test that open() reuses an externally provided S3 client."""
+    with (
+        patch.object(Settings, "_instance", None),
+        patch.object(AsyncS3Cache, "_instance", None),
+    ):
+        settings = Settings()
+        settings.cloud_container_name = "test-bucket"
+        settings.cache_file = "metadata_cache.json"
+
+        client = MagicMock()
+        cache = AsyncS3Cache(client=client)
+        await cache.open()
+
+        assert cache._client is client
+
+
+async def test_close_leaves_injected_client_open() -> None:
+    """Test that close() does not close an externally provided S3 client."""
+    with (
+        patch.object(Settings, "_instance", None),
+        patch.object(AsyncS3Cache, "_instance", None),
+    ):
+        settings = Settings()
+        settings.cloud_container_name = "test-bucket"
+        settings.cache_file = "metadata_cache.json"
+
+        client = MagicMock()
+        cache = AsyncS3Cache(client=client)
+        await cache.open()
+        await cache.close()
+
+        client.close.assert_not_called()
+        client.put_object.assert_called_once()
+
+
+async def test_save_and_load_msgpack_format() -> None:
+    """Test that a .msgpack cache key round-trips through MessagePack."""
+    with (
+        patch.object(Settings, "_instance", None),
+        patch.object(AsyncS3Cache, "_instance", None),
+    ):
+        settings = Settings()
+        settings.cloud_container_name = "test-bucket"
+        settings.cache_file = "metadata_cache.msgpack"
+
+        client = MagicMock()
+        cache = AsyncS3Cache(client=client)
+        cache._cache_data = {"recipe1": {"timestamp": "test"}}
+
+        await cache.save()
+
+        _args, kwargs = client.put_object.call_args
+        assert kwargs["ContentType"] == "application/msgpack"
+        payload = gzip.decompress(kwargs["Body"])
+        assert msgpack.unpackb(payload, raw=False) == {"recipe1": {"timestamp": "test"}}
+
+        mock_body = MagicMock()
+        mock_body.read.return_value = kwargs["Body"]
+        client.get_object.return_value = {"Body": mock_body}
+        cache._cache_data = {}
+        cache._is_loaded = False
+
+        assert await cache.load() == {"recipe1": {"timestamp": "test"}}
+
+
+async def test_invalidate_local_cache(s3_cache: AsyncS3Cache) -> None:
+    """Test that invalidate_local_cache forces a reload on the next read."""
+    s3_cache._cache_data = {"recipe1": {"timestamp": "test"}}
+    s3_cache._is_loaded = True
+
+    await s3_cache.invalidate_local_cache()
+
+    assert s3_cache._cache_data == {}
+    assert s3_cache._is_loaded is False
@@ -5,7 +5,6 @@ from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock, patch
 
-import pytest
 import pytest_asyncio
 
 from cloud_autopkg_runner import Settings
@@ -47,7 +46,6 @@ async def sqlite_cache(tmp_path: Path) -> Generator[AsyncSQLiteCache, Any, None]
         await cache.close()
 
 
-@pytest.mark.asyncio
 async def test_load_cache_success(sqlite_cache: AsyncSQLiteCache) -> None:
     """Test loading the cache successfully."""
     cache_data = await sqlite_cache.load()
@@ -56,7 +54,6 @@ async def test_load_cache_success(sqlite_cache: AsyncSQLiteCache) -> None:
     assert sqlite_cache._is_loaded is True
 
 
-@pytest.mark.asyncio
 async def test_load_cache_missing_file(sqlite_cache: AsyncSQLiteCache) -> None:
     """Test loading the cache when the key does not exist."""
     sqlite_cache._db_path.unlink()
@@ -67,7 +64,6 @@ async def test_load_cache_missing_file(sqlite_cache: AsyncSQLiteCache) -> None:
     assert sqlite_cache._is_loaded is True
 
 
-@pytest.mark.asyncio
 async def test_load_cache_invalid_json(sqlite_cache: AsyncSQLiteCache) -> None:
     """Test loading the cache when the JSON is invalid."""
     sqlite_cache._db_path.write_text("invalid json")
@@ -78,7 +74,6 @@ async def test_load_cache_invalid_json(sqlite_cache: AsyncSQLiteCache) -> None:
     assert sqlite_cache._is_loaded is True
 
 
-@pytest.mark.asyncio
 async def test_load_cache_skips_read_if_already_loaded(
     sqlite_cache: AsyncSQLiteCache,
 ) -> None:
@@ -94,7 +89,6 @@ async def test_load_cache_skips_read_if_already_loaded(
         mock_read_text.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_save_cache_success(sqlite_cache: AsyncSQLiteCache) -> None:
     """Test saving the cache successfully."""
     sqlite_cache._cache_data = {"recipe1": {"timestamp": "test"}}
@@ -117,7 +111,6 @@ async def test_save_cache_success(sqlite_cache: AsyncSQLiteCache) -> None:
     assert file_data == {"recipe1": {"timestamp": "test"}}
 
 
-@pytest.mark.asyncio
 async def test_save_cache_handles_failure(sqlite_cache: AsyncSQLiteCache) -> None:
     """Test that save handles failure gracefully."""
     sqlite_cache._cache_data = {"test_recipe": {"key": "value"}}
@@ -134,7 +127,6 @@ async def test_save_cache_handles_failure(sqlite_cache: AsyncSQLiteCache) -> Non
         )
 
 
-@pytest.mark.asyncio
 async def test_clear_cache(sqlite_cache: AsyncSQLiteCache) -> None:
     """Test clearing the cache."""
     sqlite_cache._cache_data = {"recipe1": {"timestamp": "test"}}
@@ -145,7 +137,6 @@ async def test_clear_cache(sqlite_cache: AsyncSQLiteCache) -> None:
     assert sqlite_cache._cache_data == {}
 
 
-@pytest.mark.asyncio
 async def test_get_item(sqlite_cache: AsyncSQLiteCache) -> None:
     """Test getting an item from the cache."""
     await sqlite_cache.load()
@@ -153,7 +144,6 @@ async def test_get_item(sqlite_cache: AsyncSQLiteCache) -> None:
     assert item == {"timestamp": "test"}
 
 
-@pytest.mark.asyncio
 async def test_get_item_calls_load_if_not_loaded(
     sqlite_cache: AsyncSQLiteCache,
 ) -> None:
@@ -164,7 +154,6 @@ async def test_get_item_calls_load_if_not_loaded(
         mock_load.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_get_item_returns_none_if_key_not_found(
     sqlite_cache: AsyncSQLiteCache,
 ) -> None:
@@ -175,7 +164,6 @@ async def test_get_item_returns_none_if_key_not_found(
     assert item is None
 
 
-@pytest.mark.asyncio
 async def test_set_item(sqlite_cache: AsyncSQLiteCache) -> None:
     """Test setting an item in the cache."""
     await sqlite_cache.load()
@@ -185,7 +173,6 @@ async def test_set_item(sqlite_cache: AsyncSQLiteCache) -> None:
     assert sqlite_cache._cache_data["recipe1"] == {"timestamp": "test"}
 
 
-@pytest.mark.asyncio
 async def test_delete_item(sqlite_cache: AsyncSQLiteCache) -> None:
     """Test deleting an item from the cache."""
     await sqlite_cache.load()
@@ -196,7 +183,6 @@ async def test_delete_item(sqlite_cache: AsyncSQLiteCache) -> None:
     assert "recipe1" not in sqlite_cache._cache_data
 
 
-@pytest.mark.asyncio
 async def test_delete_non_existent_key(sqlite_cache: AsyncSQLiteCache) -> None:
     """Test that delete_item() does not throw if the key does not exist."""
     sqlite_cache._is_loaded = True
@@ -205,16 +191,25 @@ async def test_delete_non_existent_key(sqlite_cache: AsyncSQLiteCache) -> None:
     assert "recipe1" in sqlite_cache._cache_data
 
 
-@pytest.mark.asyncio
 async def test_open(sqlite_cache: AsyncSQLiteCache) -> None:
     """Test that `self._conn` exists after opening."""
     await sqlite_cache.open()
     assert hasattr(sqlite_cache, "_conn")
 
 
-@pytest.mark.asyncio
 async def test_close(sqlite_cache: AsyncSQLiteCache) -> None:
     """Test that `self._conn` does not exist after closing."""
     await sqlite_cache.open()
     await sqlite_cache.close()
     assert not hasattr(sqlite_cache, "_conn")
+
+
+async def test_invalidate_local_cache(sqlite_cache: AsyncSQLiteCache) -> None:
+    """Test that invalidate_local_cache forces a reload on the next read."""
+    sqlite_cache._cache_data = {"recipe1": {"timestamp": "test"}}
+    sqlite_cache._is_loaded = True
+
+    await sqlite_cache.invalidate_local_cache()
+
+    assert sqlite_cache._cache_data == {}
+    assert sqlite_cache._is_loaded is False
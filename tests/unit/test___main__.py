@@ -244,7 +244,6 @@ def test_parse_arguments_diff_syntax() -> None:
     assert args.key == [("KEY1", "VALUE1"), ("KEY2", "VALUE2")]
 
 
-@pytest.mark.asyncio
 async def test_create_recipe_success(
     tmp_path: Path, mock_autopkg_prefs: MagicMock
 ) -> None:
@@ -267,7 +266,6 @@ async def test_create_recipe_success(
         assert isinstance(recipe, Recipe)
 
 
-@pytest.mark.asyncio
 async def test_create_recipe_invalid_file_contents(
     tmp_path: Path, mock_autopkg_prefs: MagicMock
 ) -> None:
@@ -287,7 +285,6 @@ async def test_create_recipe_invalid_file_contents(
         assert result is None
 
 
-@pytest.mark.asyncio
 async def test_create_recipe_recipe_error(
     tmp_path: Path, mock_autopkg_prefs: MagicMock
 ) -> None:
@@ -307,7 +304,6 @@ async def test_create_recipe_recipe_error(
         assert result is None
 
 
-@pytest.mark.asyncio
 async def test_get_recipe_path_success(
     tmp_path: Path, mock_autopkg_prefs: MagicMock
 ) -> None:
@@ -323,7 +319,6 @@ async def test_get_recipe_path_success(
         assert path == recipe_path
 
 
-@pytest.mark.asyncio
 async def test_get_recipe_path_recipe_lookup_error(
     mock_autopkg_prefs: MagicMock,
 ) -> None:
@@ -372,7 +367,6 @@ def test_key_value_pair_exception() -> None:
         _key_value_pair(cli_input)
 
 
-@pytest.mark.asyncio
 async def test_recipe_worker_success(tmp_path: Path) -> None:
     """_recipe_worker should process recipes and return results."""
     queue = asyncio.Queue()
@@ -398,7 +392,6 @@ async def test_recipe_worker_success(tmp_path: Path) -> None:
     assert queue.empty()
 
 
-@pytest.mark.asyncio
 async def test_recipe_worker_skips_invalid_recipe(tmp_path: Path) -> None:
     """_recipe_worker should skip when _create_recipe returns None."""
     queue = asyncio.Queue()
@@ -418,7 +411,6 @@ async def test_recipe_worker_skips_invalid_recipe(tmp_path: Path) -> None:
     assert queue.empty()
 
 
-@pytest.mark.asyncio
 async def test_recipe_worker_timeout_logged(tmp_path: Path) -> None:
     """TimeoutError during recipe.run() should be logged and skipped."""
     queue = asyncio.Queue()
@@ -446,7 +438,6 @@ async def test_recipe_worker_timeout_logged(tmp_path: Path) -> None:
     mock_logger.error.assert_called()
 
 
-@pytest.mark.asyncio
 async def test_process_recipe_list_success() -> None:
     """_process_recipe_list should process items and merge worker results."""
 
@@ -482,7 +473,6 @@ async def test_process_recipe_list_success() -> None:
     }
 
 
-@pytest.mark.asyncio
 async def test_process_recipe_list_inserts_correct_number_of_stops() -> None:
     """STOP_WORKER should be enqueued exactly once per worker."""
     pushed = []
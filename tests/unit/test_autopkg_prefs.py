@@ -26,6 +26,11 @@ from cloud_autopkg_runner.exceptions import (
     PreferenceFileNotFoundError,
 )
 
+# Serialized once at import so tests (and fixtures) reuse the same plist
+# bytes instead of re-encoding identical content per test.
+TEST_PLIST_PREFS = {"MUNKI_REPO": "/Users/Shared/MunkiRepo", "SMB_USERNAME": "testuser"}
+TEST_PLIST_BYTES = plistlib.dumps(TEST_PLIST_PREFS)
+
 
 def exclude_nans(value: Any) -> bool:
     """Filters out NaN values from Hypothesis-generated data.
@@ -49,6 +54,18 @@ def exclude_nans(value: Any) -> bool:
     return True  # Keep other types that don't have NaN components
 
 
+@pytest.fixture(scope="session")
+def valid_plist_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provides a shared, read-only plist preference file.
+
+    Written once per session; tests that only read preferences reuse it
+    instead of serializing and writing a fresh plist per test.
+    """
+    plist_path = tmp_path_factory.mktemp("prefs") / "test_prefs.plist"
+    plist_path.write_bytes(TEST_PLIST_BYTES)
+    return plist_path
+
+
 @pytest.fixture(autouse=True)
 def mock_logging() -> Mock:
     """Fixture to mock the logger used by AutoPkgPrefs.
@@ -119,25 +136,44 @@ def test_init_with_valid_json_file(tmp_path: Path) -> None:
     )
 
 
-def test_init_with_valid_plist_file(tmp_path: Path) -> None:
+def test_init_with_valid_plist_file(valid_plist_file: Path) -> None:
     """Test initialization with a valid Plist preference file.
 
     Verifies that preferences are correctly loaded and override defaults
     when provided in macOS plist format.
     """
-    test_plist_file = tmp_path / "test_prefs.plist"
-    test_plist_content = plistlib.dumps(
-        {"MUNKI_REPO": "/Users/Shared/MunkiRepo", "SMB_USERNAME": "testuser"}
-    )
-    test_plist_file.write_bytes(test_plist_content)
-
-    prefs = AutoPkgPrefs(test_plist_file)
+    prefs = AutoPkgPrefs(valid_plist_file)
     assert prefs.munki_repo == Path("/Users/Shared/MunkiRepo")
     assert prefs.smb_username == "testuser"
     # Ensure default prefs are still present if not overridden
     assert prefs.cache_dir == Path("~/Library/AutoPkg/Cache").expanduser()
 
 
+def test_init_with_plist_bytes() -> None:
+    """Test initialization with in-memory plist bytes.
+
+    Verifies that raw preference bytes are parsed without touching the
+    filesystem.
+    """
+    prefs = AutoPkgPrefs(TEST_PLIST_BYTES)
+    assert prefs.munki_repo == Path("/Users/Shared/MunkiRepo")
+    assert prefs.smb_username == "testuser"
+
+
+def test_init_with_json_bytes() -> None:
+    """Test initialization with in-memory JSON bytes."""
+    content = json.dumps({"GITHUB_TOKEN": "abc12345"}).encode("utf-8")
+
+    prefs = AutoPkgPrefs(content)
+    assert prefs.github_token == "abc12345"  # noqa: S105
+
+
+def test_init_with_invalid_bytes_raises_error() -> None:
+    """Test initialization with bytes that are neither JSON nor Plist."""
+    with pytest.raises(InvalidFileContentsError):
+        AutoPkgPrefs(b"This is not valid JSON or Plist.")
+
+
 def test_init_with_json_and_plist_like_keys(tmp_path: Path) -> None:
     """Test init with JSON and keys that look like plist.
 
@@ -607,7 +643,6 @@ def test_to_json(prefs_data: dict[str, Any]) -> None:
     assert "\n" in json_str_indented  # Check for indentation
 
 
-@pytest.mark.asyncio
 async def test_to_json_file() -> None:
     """Test serialization to a temporary JSON file.
 
@@ -644,7 +679,6 @@ async def test_to_json_file() -> None:
     assert prefs._temp_json_file_path is None
 
 
-@pytest.mark.asyncio
 async def test_to_json_file_multiple_calls_cleans_up_old() -> None:
     """Test that calling `to_json_file` multiple times cleans up previous files.
 
@@ -680,7 +714,6 @@ async def test_to_json_file_multiple_calls_cleans_up_old() -> None:
 # __enter__, __exit__, and cleanup_temp_file()
 
 
-@pytest.mark.asyncio
 async def test_context_manager_cleanup() -> None:
     """Test that the context manager automatically cleans up temporary files.
 
@@ -1022,7 +1055,6 @@ def test_clone(tmp_path: Path) -> None:
     assert cloned_prefs.get("foo2") == "cloned"
 
 
-@pytest.mark.asyncio
 async def test_clone_tmp_file_none() -> None:
     """Test cloning an instance with no preferences."""
     with patch(
@@ -57,7 +57,6 @@ def metadata_cache(tmp_path: Path) -> MetadataCache:
     }
 
 
-@pytest.mark.asyncio
 async def test_create_placeholder_files(
     tmp_path: Path, metadata_cache: MetadataCache
 ) -> None:
@@ -88,7 +87,6 @@ async def test_create_placeholder_files(
     assert file_path2.stat().st_size == 2048
 
 
-@pytest.mark.asyncio
 async def test_create_placeholder_files_skips_existing(
     tmp_path: Path, metadata_cache: MetadataCache
 ) -> None:
@@ -118,7 +116,6 @@ async def test_create_placeholder_files_skips_existing(
     assert file_path.stat().st_size == 0  # Size remains 0 as it was skipped
 
 
-@pytest.mark.asyncio
 async def test_get_file_metadata(tmp_path: Path, mock_xattr: Any) -> None:
     """Test getting file metadata."""
     file_path = tmp_path / "test_file.txt"
@@ -131,7 +128,6 @@ async def test_get_file_metadata(tmp_path: Path, mock_xattr: Any) -> None:
     assert result == "test_value"
 
 
-@pytest.mark.asyncio
 async def test_get_file_metadata_invalid_attr(tmp_path: Path) -> None:
     """Test getting file metadata."""
     file_path = tmp_path / "test_file.txt"
@@ -142,7 +138,6 @@ async def test_get_file_metadata_invalid_attr(tmp_path: Path) -> None:
     assert result is None
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("platform", "errno_to_simulate", "expected_result_is_none"),
     [
@@ -201,7 +196,6 @@ async def test_get_file_metadata_errno_behavior(
         mock_xattr.getxattr.reset_mock()  # Reset for the next parameter iteration
 
 
-@pytest.mark.asyncio
 async def test_get_file_size(tmp_path: Path) -> None:
     """Test getting file size."""
     file_path = tmp_path / "test_file.txt"
@@ -81,14 +81,12 @@ def git_client_instance(tmp_repo_path: Path) -> GitClient:
 # --- Test __init__ ---
 
 
-@pytest.mark.asyncio
 async def test_init_success(tmp_repo_path: Path) -> None:
     """Test GitClient initialization with a valid, existing path."""
     client = GitClient(tmp_repo_path)
     assert client.repo_path == tmp_repo_path.resolve()
 
 
-@pytest.mark.asyncio
 async def test_init_raises_git_repo_does_not_exist_error(tmp_path: Path) -> None:
     """Test GitClient initialization with a non-existent path."""
     non_existent_path = tmp_path / "non_existent_repo_xyz"
@@ -99,7 +97,6 @@ async def test_init_raises_git_repo_does_not_exist_error(tmp_path: Path) -> None
     assert str(non_existent_path) in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 async def test_init_raises_git_repo_does_not_exist_error_if_not_directory(
     tmp_repo_path: Path,
 ) -> None:
@@ -116,7 +113,6 @@ async def test_init_raises_git_repo_does_not_exist_error_if_not_directory(
 # --- Test _run_git_cmd ---
 
 
-@pytest.mark.asyncio
 async def test_run_git_cmd_success(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -135,7 +131,6 @@ async def test_run_git_cmd_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_run_git_cmd_raises_git_error_on_shell_command_error(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -146,7 +141,6 @@ async def test_run_git_cmd_raises_git_error_on_shell_command_error(
     assert "git status" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 async def test_run_git_cmd_raises_git_repo_does_not_exist_error_if_cwd_non_existent(
     git_client_instance: GitClient, tmp_path: Path
 ) -> None:
@@ -162,14 +156,12 @@ async def test_run_git_cmd_raises_git_repo_does_not_exist_error_if_cwd_non_exist
 # --- Test _check_is_git_repo ---
 
 
-@pytest.mark.asyncio
 async def test_check_is_git_repo_success(git_client_instance: GitClient) -> None:
     """Test _check_is_git_repo with a valid Git repository."""
     # No error should be raised. The fixture provides a valid repo.
     await git_client_instance._check_is_git_repo(git_client_instance.repo_path)
 
 
-@pytest.mark.asyncio
 async def test_check_is_git_repo_raises_git_repo_does_not_exist_error(
     git_client_instance: GitClient, tmp_path: Path
 ) -> None:
@@ -182,7 +174,6 @@ async def test_check_is_git_repo_raises_git_repo_does_not_exist_error(
     assert str(non_existent_path) in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 async def test_check_is_git_repo_raises_path_not_git_repo_error(
     git_client_instance: GitClient,
 ) -> None:
@@ -197,7 +188,6 @@ async def test_check_is_git_repo_raises_path_not_git_repo_error(
 # --- Test init ---
 
 
-@pytest.mark.asyncio
 async def test_init_creates_repo(
     tmp_path: Path, mock_run_cmd: AsyncMock, mock_logger: Logger
 ) -> None:
@@ -231,7 +221,6 @@ async def test_init_creates_repo(
     )
 
 
-@pytest.mark.asyncio
 async def test_init_with_bare(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -250,7 +239,6 @@ async def test_init_with_bare(
 # --- Test add ---
 
 
-@pytest.mark.asyncio
 async def test_add_single_file(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -266,7 +254,6 @@ async def test_add_single_file(
     )
 
 
-@pytest.mark.asyncio
 async def test_add_multiple_files(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -285,7 +272,6 @@ async def test_add_multiple_files(
 # --- Test commit ---
 
 
-@pytest.mark.asyncio
 async def test_commit_basic(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -301,7 +287,6 @@ async def test_commit_basic(
     )
 
 
-@pytest.mark.asyncio
 async def test_commit_with_all_options(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -337,7 +322,6 @@ async def test_commit_with_all_options(
 # --- Test branch ---
 
 
-@pytest.mark.asyncio
 async def test_branch_create(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -353,7 +337,6 @@ async def test_branch_create(
     )
 
 
-@pytest.mark.asyncio
 async def test_branch_create_from_start_point(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -369,7 +352,6 @@ async def test_branch_create_from_start_point(
     )
 
 
-@pytest.mark.asyncio
 async def test_branch_create_force(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -388,7 +370,6 @@ async def test_branch_create_force(
 # --- Test merge_branch ---
 
 
-@pytest.mark.asyncio
 async def test_merge_branch_success(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -414,7 +395,6 @@ async def test_merge_branch_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_merge_branch_raises_git_merge_error_if_target_not_checked_out(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -435,7 +415,6 @@ async def test_merge_branch_raises_git_merge_error_if_target_not_checked_out(
     )
 
 
-@pytest.mark.asyncio
 async def test_merge_branch_with_no_ff_and_no_edit(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -456,7 +435,6 @@ async def test_merge_branch_with_no_ff_and_no_edit(
     )
 
 
-@pytest.mark.asyncio
 async def test_merge_branch_with_squash(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -477,7 +455,6 @@ async def test_merge_branch_with_squash(
     )
 
 
-@pytest.mark.asyncio
 async def test_merge_branch_target_is_head(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -497,7 +474,6 @@ async def test_merge_branch_target_is_head(
 # --- Test checkout ---
 
 
-@pytest.mark.asyncio
 async def test_checkout_branch(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -513,7 +489,6 @@ async def test_checkout_branch(
     )
 
 
-@pytest.mark.asyncio
 async def test_checkout_new_branch(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -532,7 +507,6 @@ async def test_checkout_new_branch(
 # --- Test fetch ---
 
 
-@pytest.mark.asyncio
 async def test_fetch_default(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -548,7 +522,6 @@ async def test_fetch_default(
     )
 
 
-@pytest.mark.asyncio
 async def test_fetch_with_options(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -567,7 +540,6 @@ async def test_fetch_with_options(
 # --- Test pull ---
 
 
-@pytest.mark.asyncio
 async def test_pull_default(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -583,7 +555,6 @@ async def test_pull_default(
     )
 
 
-@pytest.mark.asyncio
 async def test_pull_with_rebase(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -602,7 +573,6 @@ async def test_pull_with_rebase(
 # --- Test push ---
 
 
-@pytest.mark.asyncio
 async def test_push_default(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -618,7 +588,6 @@ async def test_push_default(
     )
 
 
-@pytest.mark.asyncio
 async def test_push_with_force_and_set_upstream(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -639,7 +608,6 @@ async def test_push_with_force_and_set_upstream(
 # --- Test status ---
 
 
-@pytest.mark.asyncio
 async def test_status_default(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -657,7 +625,6 @@ async def test_status_default(
     )
 
 
-@pytest.mark.asyncio
 async def test_status_porcelain(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -678,7 +645,6 @@ async def test_status_porcelain(
 # --- Test get_current_branch ---
 
 
-@pytest.mark.asyncio
 async def test_get_current_branch_success(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -695,7 +661,6 @@ async def test_get_current_branch_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_get_current_branch_error(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -708,7 +673,6 @@ async def test_get_current_branch_error(
 # --- Test get_default_branch ---
 
 
-@pytest.mark.asyncio
 async def test_get_default_branch_success_main(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -737,7 +701,6 @@ async def test_get_default_branch_success_main(
     )
 
 
-@pytest.mark.asyncio
 async def test_get_default_branch_success_master(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -752,7 +715,6 @@ async def test_get_default_branch_success_master(
     assert default_branch == "master"
 
 
-@pytest.mark.asyncio
 async def test_get_default_branch_raises_git_default_branch_error_no_head_branch_line(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -768,7 +730,6 @@ async def test_get_default_branch_raises_git_default_branch_error_no_head_branch
     )
 
 
-@pytest.mark.asyncio
 async def test_get_default_branch_raises_git_error_on_underlying_failure(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -781,7 +742,6 @@ async def test_get_default_branch_raises_git_error_on_underlying_failure(
 # --- Test get_remote_url ---
 
 
-@pytest.mark.asyncio
 async def test_get_remote_url_success(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -801,7 +761,6 @@ async def test_get_remote_url_success(
 # --- Test add_remote ---
 
 
-@pytest.mark.asyncio
 async def test_add_remote_success(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -819,7 +778,6 @@ async def test_add_remote_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_add_remote_with_track_branches(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -850,7 +808,6 @@ async def test_add_remote_with_track_branches(
 # --- Test add_worktree ---
 
 
-@pytest.mark.asyncio
 async def test_add_worktree_success(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock, tmp_repo_path: Path
 ) -> None:
@@ -871,7 +828,6 @@ async def test_add_worktree_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_add_worktree_raises_creation_error_on_git_failure(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock, tmp_path: Path
 ) -> None:
@@ -884,7 +840,6 @@ async def test_add_worktree_raises_creation_error_on_git_failure(
     assert f"Failed to create worktree at {worktree_path}" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 async def test_add_worktree_raises_creation_error_on_verification_failure(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock, tmp_path: Path
 ) -> None:
@@ -901,7 +856,6 @@ async def test_add_worktree_raises_creation_error_on_verification_failure(
 # --- Test list_worktrees ---
 
 
-@pytest.mark.asyncio
 async def test_list_worktrees_success_multiple(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -934,7 +888,6 @@ HEAD 1234abcd1234abcd1234abcd1234abcd1234abcd
     )
 
 
-@pytest.mark.asyncio
 async def test_list_worktrees_success_empty(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -954,7 +907,6 @@ async def test_list_worktrees_success_empty(
 # --- Test remove_worktree ---
 
 
-@pytest.mark.asyncio
 async def test_remove_worktree_success(
     git_client_instance: GitClient,
     mock_run_cmd: AsyncMock,
@@ -979,7 +931,6 @@ async def test_remove_worktree_success(
     mock_logger.warning.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_remove_worktree_with_force(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock, tmp_path: Path
 ) -> None:
@@ -999,7 +950,6 @@ async def test_remove_worktree_with_force(
     )
 
 
-@pytest.mark.asyncio
 async def test_remove_worktree_warns_if_dir_remains(
     git_client_instance: GitClient,
     mock_run_cmd: AsyncMock,
@@ -1017,7 +967,6 @@ async def test_remove_worktree_warns_if_dir_remains(
 # --- Test prune_worktrees ---
 
 
-@pytest.mark.asyncio
 async def test_prune_worktrees_success(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock
 ) -> None:
@@ -1036,7 +985,6 @@ async def test_prune_worktrees_success(
 # --- Test move_worktree ---
 
 
-@pytest.mark.asyncio
 async def test_move_worktree_raises_missing_path_error_if_old_path_non_existent(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock, tmp_path: Path
 ) -> None:
@@ -1052,7 +1000,6 @@ async def test_move_worktree_raises_missing_path_error_if_old_path_non_existent(
     mock_run_cmd.assert_not_awaited()  # Git command should not be called
 
 
-@pytest.mark.asyncio
 async def test_move_worktree_raises_move_error_on_git_failure(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock, tmp_path: Path
 ) -> None:
@@ -1074,7 +1021,6 @@ async def test_move_worktree_raises_move_error_on_git_failure(
     )
 
 
-@pytest.mark.asyncio
 async def test_move_worktree_raises_move_error_on_verification_failure(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock, tmp_path: Path
 ) -> None:
@@ -1098,7 +1044,6 @@ async def test_move_worktree_raises_move_error_on_verification_failure(
 # --- Test lock_worktree ---
 
 
-@pytest.mark.asyncio
 async def test_lock_worktree_success(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock, tmp_path: Path
 ) -> None:
@@ -1119,7 +1064,6 @@ async def test_lock_worktree_success(
     )
 
 
-@pytest.mark.asyncio
 async def test_lock_worktree_with_reason(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock, tmp_path: Path
 ) -> None:
@@ -1141,7 +1085,6 @@ async def test_lock_worktree_with_reason(
 # --- Test unlock_worktree ---
 
 
-@pytest.mark.asyncio
 async def test_unlock_worktree_success(
     git_client_instance: GitClient, mock_run_cmd: AsyncMock, tmp_path: Path
 ) -> None:
@@ -160,7 +160,6 @@ def test_recipe_properties(tmp_path: Path, mock_autopkg_prefs: MagicMock) -> Non
     assert recipe.process == []
 
 
-@pytest.mark.asyncio
 async def test_autopkg_run_cmd_basic(
     tmp_path: Path, mock_autopkg_prefs: MagicMock
 ) -> None:
@@ -192,7 +191,6 @@ async def test_autopkg_run_cmd_basic(
         assert not any(arg.startswith("--key=") for arg in cmd)
 
 
-@pytest.mark.asyncio
 async def test_autopkg_run_cmd_with_check(
     tmp_path: Path, mock_autopkg_prefs: MagicMock
 ) -> None:
@@ -221,7 +219,6 @@ async def test_autopkg_run_cmd_with_check(
         assert "--check" in cmd
 
 
-@pytest.mark.asyncio
 async def test_autopkg_run_cmd_with_processors_and_verbosity(
     tmp_path: Path, mock_autopkg_prefs: MagicMock
 ) -> None:
@@ -259,7 +256,6 @@ async def test_autopkg_run_cmd_with_processors_and_verbosity(
         assert "-v" in cmd
 
 
-@pytest.mark.asyncio
 async def test_autopkg_run_cmd_with_input_variables(
     tmp_path: Path, mock_autopkg_prefs: MagicMock
 ) -> None:
@@ -293,7 +289,6 @@ async def test_autopkg_run_cmd_with_input_variables(
         assert "--key=KEY2=value2" in cmd
 
 
-@pytest.mark.asyncio
 async def test_create_placeholder_cache_files_first_run(
     tmp_path: Path, mock_autopkg_prefs: MagicMock
 ) -> None:
@@ -326,7 +321,6 @@ async def test_create_placeholder_cache_files_first_run(
         assert recipe._placeholder_files_created is True
 
 
-@pytest.mark.asyncio
 async def test_create_placeholder_cache_files_subsequent_run(
     tmp_path: Path, mock_autopkg_prefs: MagicMock
 ) -> None:
@@ -356,7 +350,6 @@ async def test_create_placeholder_cache_files_subsequent_run(
         mock_create_placeholder_files.assert_not_called()
 
 
-@pytest.mark.asyncio
 async def test_get_metadata_for_item_all_present() -> None:
     """Test _get_metadata_for_item when all metadata is present."""
     test_file_path_str = "/tmp/test_downloaded_file.dmg"
@@ -402,7 +395,6 @@ async def test_get_metadata_for_item_all_present() -> None:
         }
 
 
-@pytest.mark.asyncio
 async def test_get_metadata_for_item_missing_optional_metadata() -> None:
     """Test _get_metadata_for_item when etag and last_modified are missing."""
     test_file_path_str = "/tmp/test_downloaded_file.dmg"
@@ -444,7 +436,6 @@ async def test_get_metadata_for_item_missing_optional_metadata() -> None:
         assert "last_modified" not in result
 
 
-@pytest.mark.asyncio
 async def test_get_metadata_for_item_file_size_error() -> None:
     """Test _get_metadata_for_item when get_file_size raises an OSError."""
     test_file_path_str = "/tmp/test_downloaded_file.dmg"
@@ -465,7 +456,6 @@ async def test_get_metadata_for_item_file_size_error() -> None:
         mock_get_file_size.assert_called_once_with(test_file_path)
 
 
-@pytest.mark.asyncio
 async def test_get_metadata_for_item_etag_error() -> None:
     """Test _get_metadata_for_item when etag retrieval raises an OSError."""
     test_file_path_str = "/tmp/test_downloaded_file.dmg"
@@ -499,7 +489,6 @@ async def test_get_metadata_for_item_etag_error() -> None:
         )
 
 
-@pytest.mark.asyncio
 async def test_get_metadata_for_item_last_modified_error() -> None:
     """Test _get_metadata_for_item when last_modified retrieval raises an OSError."""
     test_file_path_str = "/tmp/test_downloaded_file.dmg"
@@ -99,7 +99,6 @@ def test_path_within_depth_outside_base(tmp_path: Path) -> None:
     )
 
 
-@pytest.mark.asyncio
 async def test_find_recursively_found(
     recipe_finder: RecipeFinder, tmp_path: Path
 ) -> None:
@@ -116,7 +115,6 @@ async def test_find_recursively_found(
     assert found_path == target_file
 
 
-@pytest.mark.asyncio
 async def test_find_recursively_not_found(
     recipe_finder: RecipeFinder, tmp_path: Path
 ) -> None:
@@ -152,7 +150,6 @@ def test_find_in_directory_not_found(
     assert found_path is None
 
 
-@pytest.mark.asyncio
 async def test_find_in_directory_recursively_found(
     recipe_finder: RecipeFinder, tmp_path: Path
 ) -> None:
@@ -169,7 +166,6 @@ async def test_find_in_directory_recursively_found(
     assert found_path == target_file
 
 
-@pytest.mark.asyncio
 async def test_find_in_directory_recursively_not_found(
     recipe_finder: RecipeFinder, tmp_path: Path
 ) -> None:
@@ -183,7 +179,6 @@ async def test_find_in_directory_recursively_not_found(
     assert found_path is None
 
 
-@pytest.mark.asyncio
 async def test_search_directory_direct_match(
     recipe_finder: RecipeFinder, tmp_path: Path
 ) -> None:
@@ -197,7 +192,6 @@ async def test_search_directory_direct_match(
     assert found_path == target_file
 
 
-@pytest.mark.asyncio
 async def test_search_directory_recursive_match(
     recipe_finder: RecipeFinder, tmp_path: Path
 ) -> None:
@@ -212,7 +206,6 @@ async def test_search_directory_recursive_match(
     assert found_path == target_file
 
 
-@pytest.mark.asyncio
 async def test_search_directory_not_found(
     recipe_finder: RecipeFinder, tmp_path: Path
 ) -> None:
@@ -226,7 +219,6 @@ async def test_search_directory_not_found(
     assert found_path is None
 
 
-@pytest.mark.asyncio
 async def test_find_recipe_direct_match(
     recipe_finder: RecipeFinder, tmp_path: Path
 ) -> None:
@@ -239,7 +231,6 @@ async def test_find_recipe_direct_match(
     assert found_path == recipe_file
 
 
-@pytest.mark.asyncio
 async def test_find_recipe_recursive_match(
     recipe_finder: RecipeFinder, tmp_path: Path
 ) -> None:
@@ -252,14 +243,12 @@ async def test_find_recipe_recursive_match(
     assert found_path == recipe_file
 
 
-@pytest.mark.asyncio
 async def test_find_recipe_not_found(recipe_finder: RecipeFinder) -> None:
     """Test find_recipe method when the recipe is not found."""
     with pytest.raises(RecipeLookupError):
         await recipe_finder.find_recipe("NonExistentRecipe")
 
 
-@pytest.mark.asyncio
 async def test_find_recipe_prefers_override(
     recipe_finder: RecipeFinder, tmp_path: Path
 ) -> None:
@@ -277,7 +266,6 @@ async def test_find_recipe_prefers_override(
     assert found_path == override_recipe
 
 
-@pytest.mark.asyncio
 async def test_find_recipe_handles_tilde_expansion(
     recipe_finder: RecipeFinder, tmp_path: Path
 ) -> None:
@@ -302,7 +290,6 @@ async def test_find_recipe_handles_tilde_expansion(
         assert found_path == recipe_file
 
 
-@pytest.mark.asyncio
 async def test_find_recipe_custom_recursion_depth(tmp_path: Path) -> None:
     """Test find_recipe with a custom recursion depth."""
     mock_prefs = MagicMock()
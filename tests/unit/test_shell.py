@@ -6,7 +6,6 @@ from cloud_autopkg_runner import shell
 from cloud_autopkg_runner.exceptions import ShellCommandError
 
 
-@pytest.mark.asyncio
 async def test_run_cmd_success() -> None:
     """Test successful command execution."""
     returncode, stdout, stderr = await shell.run_cmd("echo 'Hello, world!'")
@@ -15,7 +14,6 @@ async def test_run_cmd_success() -> None:
     assert not stderr
 
 
-@pytest.mark.asyncio
 async def test_run_cmd_failure() -> None:
     """Test command execution with a non-zero exit code."""
     with pytest.raises(ShellCommandError) as exc_info:
@@ -23,7 +21,6 @@ async def test_run_cmd_failure() -> None:
     assert "Command failed with exit code 1: false" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 async def test_run_cmd_no_check() -> None:
     """Test command execution with check=False."""
     returncode, stdout, stderr = await shell.run_cmd("false", check=False)
@@ -32,7 +29,6 @@ async def test_run_cmd_no_check() -> None:
     assert not stderr
 
 
-@pytest.mark.asyncio
 async def test_run_cmd_capture_output_false() -> None:
     """Test command execution with capture_output=False."""
     returncode, stdout, stderr = await shell.run_cmd(
@@ -43,7 +39,6 @@ async def test_run_cmd_capture_output_false() -> None:
     assert not stderr
 
 
-@pytest.mark.asyncio
 async def test_run_cmd_cwd(tmp_path: Path) -> None:
     """Test command execution with a specified working directory."""
     # Create a file in the temporary directory
@@ -59,7 +54,6 @@ async def test_run_cmd_cwd(tmp_path: Path) -> None:
     assert not stderr
 
 
-@pytest.mark.asyncio
 async def test_run_cmd_timeout() -> None:
     """Test command execution with a timeout."""
     with pytest.raises(ShellCommandError) as exc_info:
@@ -67,7 +61,6 @@ async def test_run_cmd_timeout() -> None:
     assert "Command failed with exit code -1: sleep 2" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 async def test_run_cmd_command_not_found() -> None:
     """Test command execution when the command is not found."""
     with pytest.raises(ShellCommandError) as exc_info:
@@ -75,7 +68,6 @@ async def test_run_cmd_command_not_found() -> None:
     assert "Command not found: nonexistent_command" in str(exc_info.value)
 
 
-@pytest.mark.asyncio
 async def test_run_cmd_shell_injection_safe() -> None:
     """Test that shell.run_cmd is safe from shell injection."""
     # Attempt to inject a command using a semicolon
@@ -94,7 +86,6 @@ async def test_run_cmd_shell_injection_safe() -> None:
     assert not file_path.exists()
 
 
-@pytest.mark.asyncio
 async def test_run_cmd_list_command() -> None:
     """Test command execution with a list command."""
     returncode, stdout, stderr = await shell.run_cmd(["echo", "Hello, world!"])
@@ -103,7 +94,6 @@ async def test_run_cmd_list_command() -> None:
     assert not stderr
 
 
-@pytest.mark.asyncio
 async def test_run_cmd_file_not_found_error(tmp_path: Path) -> None:
     """Test FileNotFoundError when the command tries to access a non-existent file."""
     # Create a temporary directory
@@ -117,7 +107,6 @@ async def test_run_cmd_file_not_found_error(tmp_path: Path) -> None:
     )
 
 
-@pytest.mark.asyncio
 async def test_run_cmd_os_error() -> None:
     """Test OSError when the command encounters an OS-level error."""
     # Use an invalid command that will cause an OSError